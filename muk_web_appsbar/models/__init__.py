@@ -1,4 +1,5 @@
 from . import ir_http
+from . import ir_ui_menu
 from . import res_users
 from . import res_company
 from . import res_config_settings
@@ -12,9 +12,23 @@ class IrHttp(models.AbstractModel):
     
     def session_info(self):
         result = super(IrHttp, self).session_info()
+        result.setdefault('ui_preferences', {}).update({
+            'sidebar_type': self.env.user.sidebar_type,
+        })
         if request.env.user._is_internal():
-            for company in request.env.user.company_ids.with_context(bin_size=True):
-                result['user_companies']['allowed_companies'][company.id].update({
-                    'has_appsbar_image': bool(company.appbar_image),
+            result['appsbar_render_limit'] = int(
+                request.env['ir.config_parameter'].sudo().get_param(
+                    'muk_web_appsbar.sidebar_render_limit', 0
+                )
+            )
+            companies = request.env['res.company'].sudo()
+            allowed_companies = result['user_companies']['allowed_companies']
+            for company_id, company in allowed_companies.items():
+                unique = companies._get_session_image_unique(
+                    company_id, 'appbar_image'
+                )
+                company.update({
+                    'has_appsbar_image': bool(unique),
+                    'appsbar_image_unique': unique,
                 })
         return result
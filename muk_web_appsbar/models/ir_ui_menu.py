@@ -0,0 +1,54 @@
+from odoo import models, api, tools
+
+
+class IrUiMenu(models.Model):
+    
+    _inherit = 'ir.ui.menu'
+    
+    #----------------------------------------------------------
+    # Helper
+    #----------------------------------------------------------
+    
+    @api.model
+    @tools.ormcache()
+    def _get_web_icon_checksums(self):
+        self.flush_model(['web_icon_data'])
+        self.env.cr.execute("""
+            SELECT res_id, checksum
+            FROM ir_attachment
+            WHERE res_model = 'ir.ui.menu' AND res_field = 'web_icon_data'
+        """)
+        return dict(self.env.cr.fetchall())
+    
+    @api.model
+    def _get_apps_skeleton(self, debug):
+        web_menus = self.load_web_menus(debug)
+        return [
+            {
+                'id': web_menus[app_id]['id'],
+                'name': web_menus[app_id]['name'],
+                'icon_url': (
+                    web_menus[app_id].get('webIconDataUrl') or 
+                    '/base/static/description/icon.png'
+                ),
+            }
+            for app_id in web_menus['root']['children']
+        ]
+    
+    #----------------------------------------------------------
+    # Functions
+    #----------------------------------------------------------
+    
+    @api.model
+    def load_web_menus(self, debug):
+        web_menus = super().load_web_menus(debug)
+        checksums = self._get_web_icon_checksums()
+        for menu_id, menu in web_menus.items():
+            if menu.get('webIconData') and menu_id in checksums:
+                menu['webIconData'] = False
+                menu['webIconDataUrl'] = (
+                    '/web/image/ir.ui.menu/%s/web_icon_data?unique=%s' % (
+                        menu_id, checksums[menu_id]
+                    )
+                )
+        return web_menus
@@ -1,10 +1,22 @@
-from odoo import models, fields
+from collections import defaultdict
+
+from odoo import models, fields, api, tools
 
 
 class ResCompany(models.Model):
     
     _inherit = 'res.company'
     
+    #----------------------------------------------------------
+    # Properties
+    #----------------------------------------------------------
+    
+    @property
+    def SESSION_IMAGE_FIELDS(self):
+        return [
+            'appbar_image',
+        ]
+    
     #----------------------------------------------------------
     # Fields
     #----------------------------------------------------------
@@ -13,3 +25,48 @@ class ResCompany(models.Model):
         string='Apps Menu Footer Image',
         attachment=True
     )
+    
+    #----------------------------------------------------------
+    # Helper
+    #----------------------------------------------------------
+    
+    @api.model
+    @tools.ormcache()
+    def _get_session_image_checksums(self):
+        self.flush_model(self.SESSION_IMAGE_FIELDS)
+        self.env.cr.execute("""
+            SELECT res_id, res_field, checksum
+            FROM ir_attachment
+            WHERE res_model = 'res.company' AND res_field IN %s
+        """, [tuple(self.SESSION_IMAGE_FIELDS)])
+        image_checksums = defaultdict(dict)
+        for company_id, field, checksum in self.env.cr.fetchall():
+            image_checksums[company_id][field] = checksum
+        return dict(image_checksums)
+
+    @api.model
+    def _get_session_image_unique(self, company_id, field):
+        return self._get_session_image_checksums().get(
+            company_id, {}
+        ).get(field, False)
+    
+    #----------------------------------------------------------
+    # ORM
+    #----------------------------------------------------------
+    
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        if any(
+            field in vals 
+            for vals in vals_list 
+            for field in self.SESSION_IMAGE_FIELDS
+        ):
+            self.env.registry.clear_cache()
+        return records
+    
+    def write(self, vals):
+        res = super().write(vals)
+        if any(field in vals for field in self.SESSION_IMAGE_FIELDS):
+            self.env.registry.clear_cache()
+        return res
@@ -13,3 +13,13 @@ class ResConfigSettings(models.TransientModel):
         related='company_id.appbar_image',
         readonly=False
     )
+    
+    appbar_skeleton = fields.Boolean(
+        string='Render AppsBar on Server',
+        config_parameter='muk_web_appsbar.sidebar_skeleton',
+    )
+    
+    appbar_render_limit = fields.Integer(
+        string='AppsBar Render Limit',
+        config_parameter='muk_web_appsbar.sidebar_render_limit',
+    )
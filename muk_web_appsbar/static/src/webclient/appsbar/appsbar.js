@@ -1,9 +1,12 @@
 /** @odoo-module **/
 
+import { session } from '@web/session';
 import { url } from '@web/core/utils/urls';
 import { useService } from '@web/core/utils/hooks';
 
-import { Component, onWillUnmount } from '@odoo/owl';
+import { 
+	Component, onMounted, onWillUnmount, useEffect, useRef, useState 
+} from '@odoo/owl';
 
 export class AppsBar extends Component {
 	static template = 'muk_web_appsbar.AppsBar';
@@ -11,23 +14,60 @@ export class AppsBar extends Component {
 	setup() {
 		this.companyService = useService('company');
         this.appMenuService = useService('app_menu');
+        this.apps = this.appMenuService.getAppsMenuItems();
+        this.state = useState({
+        	currentAppId: this.appMenuService.getCurrentApp()?.id,
+        	renderLimit: session.appsbar_render_limit || 0,
+        });
+        this.panelRef = useRef('panel');
+        this.sentinelRef = useRef('sentinel');
+        useEffect(
+        	(sentinel, renderLimit) => {
+        		if (!sentinel) {
+        			return;
+        		}
+        		const observer = new IntersectionObserver((entries) => {
+        			if (entries.some((entry) => entry.isIntersecting)) {
+        				this.state.renderLimit += session.appsbar_render_limit;
+        			}
+        		}, { root: this.panelRef.el, rootMargin: '100px' });
+        		observer.observe(sentinel);
+        		return () => observer.disconnect();
+        	},
+        	() => [this.sentinelRef.el, this.state.renderLimit]
+        );
     	if (this.companyService.currentCompany.has_appsbar_image) {
             this.sidebarImageUrl = url('/web/image', {
                 model: 'res.company',
                 field: 'appbar_image',
                 id: this.companyService.currentCompany.id,
+                unique: this.companyService.currentCompany.appsbar_image_unique,
             });
     	}
     	const renderAfterMenuChange = () => {
-            this.render();
+    		this.state.currentAppId = this.appMenuService.getCurrentApp()?.id;
+    		const apps = this.appMenuService.getAppsMenuItems();
+    		if (apps !== this.apps) {
+    			this.apps = apps;
+    			this.render();
+    		}
         };
         this.env.bus.addEventListener(
         	'MENUS:APP-CHANGED', renderAfterMenuChange
         );
+        onMounted(() => {
+        	document.querySelector('.mk_apps_sidebar_skeleton')?.remove();
+        });
         onWillUnmount(() => {
             this.env.bus.removeEventListener(
             	'MENUS:APP-CHANGED', renderAfterMenuChange
             );
         });
     }
+    getVisibleApps() {
+    	if (!this.state.renderLimit || this.state.renderLimit >= this.apps.length) {
+    		return this.apps;
+    	}
+    	return this.apps.slice(0, this.state.renderLimit);
+    }
 }
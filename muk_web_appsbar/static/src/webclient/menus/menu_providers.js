@@ -0,0 +1,36 @@
+/** @odoo-module **/
+
+import { registry } from "@web/core/registry";
+
+import "@web/webclient/menus/menu_providers";
+
+const commandProviderRegistry = registry.category("command_provider");
+
+const menuProvider = commandProviderRegistry.get("menu", null);
+
+if (menuProvider) {
+	// app icons are loaded by url, see ir.ui.menu.load_web_menus
+	commandProviderRegistry.add("menu", {
+		...menuProvider,
+		async provide(env, options) {
+			const result = await menuProvider.provide(env, options);
+			const apps = env.services.menu.getApps();
+			const iconsById = new Map(apps.map((app) => [app.id, app.webIconDataUrl]));
+			const iconsByName = new Map(apps.map((app) => [app.name, app.webIconDataUrl]));
+			for (const command of result) {
+				if (command.category !== "apps" || !command.props) {
+					continue;
+				}
+				const match = /menu_id=(\d+)/.exec(command.href || "");
+				const iconUrl = (
+					match ? iconsById.get(Number(match[1])) : iconsByName.get(command.name)
+				);
+				if (iconUrl) {
+					command.props = { ...command.props, webIconData: iconUrl };
+					delete command.props.webIcon;
+				}
+			}
+			return result;
+		},
+	}, { force: true });
+}
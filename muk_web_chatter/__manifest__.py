@@ -5,7 +5,7 @@
         This module improves the design of the chatter and adds a user
         preference to set the position of the chatter in the form view.
     ''',
-    'version': '17.0.1.2.0',
+    'version': '17.0.1.3.6',
     'category': 'Tools/UI',
     'license': 'LGPL-3', 
     'author': 'MuK IT',
@@ -39,6 +39,9 @@
             ),
             'muk_web_chatter/static/src/views/form/form_renderer.js',
         ],
+        'web.qunit_suite_tests': [
+            'muk_web_chatter/static/tests/**/*.js',
+        ],
     },
     'images': [
         'static/description/banner.png',
@@ -12,5 +12,9 @@ class IrHttp(models.AbstractModel):
     
     def session_info(self):
         result = super(IrHttp, self).session_info()
-        result['chatter_position'] = self.env.user.chatter_position
+        result.setdefault('ui_preferences', {}).update({
+            'chatter_position': self.env.user.chatter_position,
+            'chatter_width': self.env.user.chatter_width,
+            'chatter_tracking': self.env.user.chatter_tracking,
+        })
         return result
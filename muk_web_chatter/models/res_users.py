@@ -13,12 +13,16 @@ class ResUsers(models.Model):
     def SELF_READABLE_FIELDS(self):
         return super().SELF_READABLE_FIELDS + [
             'chatter_position',
+            'chatter_width',
+            'chatter_tracking',
         ]
 
     @property
     def SELF_WRITEABLE_FIELDS(self):
         return super().SELF_WRITEABLE_FIELDS + [
             'chatter_position',
+            'chatter_width',
+            'chatter_tracking',
         ]
 
     #----------------------------------------------------------
@@ -34,3 +38,12 @@ class ResUsers(models.Model):
         default='side',
         required=True,
     )
+    
+    chatter_width = fields.Integer(
+        string="Chatter Width",
+    )
+    
+    chatter_tracking = fields.Boolean(
+        string="Chatter Tracking",
+        default=True,
+    )
@@ -1,26 +1,26 @@
 /* @odoo-module */
 
 import { patch } from "@web/core/utils/patch";
-import { browser } from "@web/core/browser/browser";
+import { session } from "@web/session";
 
 import { Chatter } from "@mail/core/web/chatter";
 
 patch(Chatter.prototype, {
     setup() {
         super.setup();
-        const showTracking = browser.localStorage.getItem(
-            'muk_web_chatter.tracking'
-        );
         this.state.showTracking = (
-            showTracking != null ? JSON.parse(showTracking) : true
+            session.ui_preferences?.chatter_tracking ?? true
         );
     },
     onClickTrackingToggle() {
         const showTracking = !this.state.showTracking;
-        browser.localStorage.setItem(
-            'muk_web_chatter.tracking', showTracking
-        );
         this.state.showTracking = showTracking;
+        if (session.ui_preferences) {
+            session.ui_preferences.chatter_tracking = showTracking;
+        }
+        this.env.services.orm.write('res.users', [session.uid], {
+            chatter_tracking: showTracking,
+        });
     },
 });
 
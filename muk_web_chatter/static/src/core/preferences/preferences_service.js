@@ -0,0 +1,44 @@
+/* @odoo-module */
+
+import { registry } from "@web/core/registry";
+import { session } from "@web/session";
+import { browser } from "@web/core/browser/browser";
+
+const WIDTH_KEY = 'muk_web_chatter.width';
+const TRACKING_KEY = 'muk_web_chatter.tracking';
+
+export const chatterPreferencesService = {
+    dependencies: ["orm"],
+    start(env, { orm }) {
+        // one time migration of the former local storage preferences
+        const width = browser.localStorage.getItem(WIDTH_KEY);
+        const tracking = browser.localStorage.getItem(TRACKING_KEY);
+        if (width === null && tracking === null) {
+            return;
+        }
+        const preferences = session.ui_preferences || {};
+        const values = {};
+        if (width !== null && !preferences.chatter_width) {
+            const chatterWidth = parseInt(width, 10);
+            if (chatterWidth > 0) {
+                values.chatter_width = chatterWidth;
+            }
+        }
+        if (tracking === 'false' && preferences.chatter_tracking !== false) {
+            values.chatter_tracking = false;
+        }
+        const removeKeys = () => {
+            browser.localStorage.removeItem(WIDTH_KEY);
+            browser.localStorage.removeItem(TRACKING_KEY);
+        };
+        if (!session.uid || !Object.keys(values).length) {
+            removeKeys();
+            return;
+        }
+        Object.assign(preferences, values);
+        session.ui_preferences = preferences;
+        orm.write('res.users', [session.uid], values).then(removeKeys);
+    },
+};
+
+registry.category("services").add("muk_chatter_preferences", chatterPreferencesService);
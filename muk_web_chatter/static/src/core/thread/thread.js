@@ -6,18 +6,70 @@ import { browser } from "@web/core/browser/browser";
 import { Thread } from '@mail/core/common/thread';
 
 patch(Thread.prototype, {
-    get displayMessages() {
-        let messages = (
-            this.props.order === 'asc' ?
-            this.props.thread.nonEmptyMessages :
-            [...this.props.thread.nonEmptyMessages].reverse()
+    isDisplayMessage(msg) {
+        return (
+            !msg.isEmpty && (
+                this.props.showTrackingMessages || 
+                msg.trackingValues.length == 0
+            )
         );
-        if (!this.props.showTrackingMessages) {
-            messages = messages.filter(
-                (msg) => msg.trackingValues.length == 0
+    },
+    get displayMessages() {
+        // messages that are emptied in place stay in the cached lists,
+        // the template skips them with the same isEmpty check
+        const thread = this.props.thread;
+        const messages = thread.messages;
+        const length = messages.length;
+        const firstId = length ? messages[0].id : undefined;
+        const lastId = length ? messages[length - 1].id : undefined;
+        let cache = this.displayMessagesCache;
+        if (
+            !cache || 
+            cache.thread !== thread || 
+            cache.messages !== messages || 
+            cache.showTrackingMessages !== this.props.showTrackingMessages
+        ) {
+            cache = null;
+        } else if (
+            length > cache.length && 
+            firstId === cache.firstId && 
+            messages[cache.length - 1]?.id === cache.lastId
+        ) {
+            const added = messages.slice(cache.length).filter(
+                (msg) => this.isDisplayMessage(msg)
             );
+            cache.asc.push(...added);
+            cache.desc.unshift(...added.reverse());
+        } else if (
+            length > cache.length && 
+            lastId === cache.lastId && 
+            messages[length - cache.length]?.id === cache.firstId
+        ) {
+            const added = messages.slice(0, length - cache.length).filter(
+                (msg) => this.isDisplayMessage(msg)
+            );
+            cache.asc.unshift(...added);
+            cache.desc.push(...added.reverse());
+        } else if (
+            length !== cache.length || 
+            firstId !== cache.firstId || 
+            lastId !== cache.lastId
+        ) {
+            cache = null;
+        }
+        if (!cache) {
+            const asc = messages.filter((msg) => this.isDisplayMessage(msg));
+            cache = {
+                thread,
+                messages,
+                showTrackingMessages: this.props.showTrackingMessages,
+                asc,
+                desc: [...asc].reverse(),
+            };
         }
-        return messages;
+        Object.assign(cache, { length, firstId, lastId });
+        this.displayMessagesCache = cache;
+        return this.props.order === 'asc' ? cache.asc : cache.desc;
     },
 });
 
@@ -7,8 +7,10 @@ import { append, createElement, setAttributes } from '@web/core/utils/xml';
 import {FormCompiler} from '@web/views/form/form_compiler';
 
 patch(FormCompiler.prototype, {
-    compile(node, params) {
-        const res = super.compile(node, params);
+    compile(key, params = {}) {
+        return this.compileChatter(super.compile(key, params));
+    },
+    compileChatter(res) {
         const chatterContainerHookXml = res.querySelector(
             '.o_form_renderer > .o-mail-Form-chatter'
         );
@@ -18,7 +20,7 @@ patch(FormCompiler.prototype, {
         setAttributes(chatterContainerHookXml, {
             't-ref': 'chatterContainer',
         });
-        if (session.chatter_position === 'bottom') {
+        if (session.ui_preferences?.chatter_position === 'bottom') {
             const formSheetBgXml = res.querySelector('.o_form_sheet_bg');
             if (!chatterContainerHookXml || !formSheetBgXml?.parentNode) {
             	return res;
@@ -53,7 +55,7 @@ patch(FormCompiler.prototype, {
             }
         } else {
             setAttributes(chatterContainerHookXml, {
-                't-att-style': '__comp__.chatterState.width ? `width: ${__comp__.chatterState.width}px;` : ""',
+                't-att-style': '__comp__.chatterState.width ? `--mk-chatter-width: ${__comp__.chatterState.width}px;` : ""',
             });
             const chatterContainerResizeHookXml = createElement('span');
             chatterContainerResizeHookXml.classList.add('mk_chatter_resize');
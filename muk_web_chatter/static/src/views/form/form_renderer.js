@@ -11,7 +11,7 @@ patch(FormRenderer.prototype, {
     setup() {
         super.setup();
         this.chatterState = useState({
-            width: browser.localStorage.getItem('muk_web_chatter.width'),
+            width: session.ui_preferences?.chatter_width,
         });
         this.chatterContainer = useRef('chatterContainer');
     },
@@ -22,18 +22,29 @@ patch(FormRenderer.prototype, {
         const initialX = ev.pageX;
         const chatterElement = this.chatterContainer.el;
         const initialWidth = chatterElement.offsetWidth;
+        const maxWidth = Math.max(
+            chatterElement.parentElement.offsetWidth - 250, 250
+        );
         const resizeStoppingEvents = [
             'keydown', 'mousedown', 'mouseup'
         ];
+        let newWidth = initialWidth;
+        let animationFrame = null;
+        const applyWidth = () => {
+            animationFrame = null;
+            chatterElement.style.setProperty(
+                '--mk-chatter-width', `${newWidth}px`
+            );
+        };
         const resizePanel = (ev) => {
             ev.preventDefault();
             ev.stopPropagation();
-            const newWidth = Math.min(
-                Math.max(50, initialWidth - (ev.pageX - initialX)),
-                Math.max(chatterElement.parentElement.offsetWidth - 250, 250)
+            newWidth = Math.min(
+                Math.max(50, initialWidth - (ev.pageX - initialX)), maxWidth
             );
-            browser.localStorage.setItem('muk_web_chatter.width', newWidth);
-            this.chatterState.width = newWidth;
+            if (!animationFrame) {
+                animationFrame = browser.requestAnimationFrame(applyWidth);
+            }
         };
         const stopResize = (ev) => {
             ev.preventDefault();
@@ -45,6 +56,13 @@ patch(FormRenderer.prototype, {
             resizeStoppingEvents.forEach((stoppingEvent) => {
                 document.removeEventListener(stoppingEvent, stopResize, true);
             });
+            if (animationFrame) {
+                browser.cancelAnimationFrame(animationFrame);
+                applyWidth();
+            }
+            if (newWidth !== initialWidth) {
+                this.saveChatterWidth(newWidth);
+            }
             document.activeElement.blur();
         };
         document.addEventListener('mousemove', resizePanel, true);
@@ -53,7 +71,16 @@ patch(FormRenderer.prototype, {
         });
     },
     onDoubleClickChatterResize(ev) {
-    	browser.localStorage.removeItem('muk_web_chatter.width');
-        this.chatterState.width = false;
+        this.chatterContainer.el?.style.removeProperty('--mk-chatter-width');
+        this.saveChatterWidth(false);
+    },
+    saveChatterWidth(width) {
+        this.chatterState.width = width;
+        if (session.ui_preferences) {
+            session.ui_preferences.chatter_width = width;
+        }
+        this.env.services.orm.write('res.users', [session.uid], {
+            chatter_width: width || 0,
+        });
     },
 });
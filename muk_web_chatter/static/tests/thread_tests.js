@@ -0,0 +1,90 @@
+/** @odoo-module */
+
+import { Thread } from "@mail/core/common/thread";
+
+const MESSAGE_COUNT = 5000;
+
+function makeMessages(start, count) {
+    return Array.from({ length: count }, (_, index) => ({
+        id: start + index,
+        isEmpty: false,
+        trackingValues: (start + index) % 3 ? [] : [{ id: start + index }],
+    }));
+}
+
+function makeThread(messages, props = {}) {
+    const thread = Object.create(Thread.prototype);
+    thread.props = {
+        thread: { messages },
+        showTrackingMessages: false,
+        order: "asc",
+        ...props,
+    };
+    return thread;
+}
+
+function expected(messages, order = "asc") {
+    const result = messages.filter((msg) => msg.trackingValues.length === 0);
+    return order === "asc" ? result : result.reverse();
+}
+
+function measure(callback, runs = 20) {
+    const start = performance.now();
+    for (let run = 0; run < runs; run++) {
+        callback(run);
+    }
+    return (performance.now() - start) / runs;
+}
+
+QUnit.module("muk_web_chatter", {}, function () {
+    QUnit.module("Thread");
+
+    QUnit.test("display messages are updated incrementally", async function (assert) {
+        const messages = makeMessages(1000, 100);
+        const asc = makeThread(messages);
+        const desc = makeThread(messages, { order: "desc" });
+        const list = asc.displayMessages;
+        assert.deepEqual(list, expected(messages));
+        assert.deepEqual(desc.displayMessages, expected(messages, "desc"));
+        assert.strictEqual(asc.displayMessages, list);
+
+        messages.push(...makeMessages(1100, 10));
+        assert.strictEqual(asc.displayMessages, list);
+        assert.deepEqual(list, expected(messages));
+        assert.deepEqual(desc.displayMessages, expected(messages, "desc"));
+
+        messages.unshift(...makeMessages(990, 10));
+        assert.strictEqual(asc.displayMessages, list);
+        assert.deepEqual(list, expected(messages));
+        assert.deepEqual(desc.displayMessages, expected(messages, "desc"));
+
+        messages.splice(50, 1);
+        assert.notStrictEqual(asc.displayMessages, list);
+        assert.deepEqual(asc.displayMessages, expected(messages));
+
+        asc.props = { ...asc.props, showTrackingMessages: true };
+        assert.deepEqual(asc.displayMessages, messages);
+    });
+
+    QUnit.test("display messages benchmark with 5000 messages", async function (assert) {
+        const messages = makeMessages(0, MESSAGE_COUNT);
+        const thread = makeThread(messages);
+        const filter = measure(() => {
+            thread.displayMessagesCache = null;
+            return thread.displayMessages;
+        });
+        const cached = measure(() => thread.displayMessages);
+        const append = measure((run) => {
+            messages.push(...makeMessages(MESSAGE_COUNT + run * 10, 10));
+            return thread.displayMessages;
+        });
+        assert.deepEqual(thread.displayMessages, expected(messages));
+        assert.ok(cached <= filter, "cached access is not slower than a full filter");
+        console.info(
+            `muk_web_chatter thread benchmark (${MESSAGE_COUNT} messages): ` +
+            `full filter ${filter.toFixed(3)}ms, ` +
+            `cached ${cached.toFixed(3)}ms, ` +
+            `append ${append.toFixed(3)}ms`
+        );
+    });
+});
@@ -1,6 +1,11 @@
 from . import models
+from . import controllers
 
 
 def _uninstall_cleanup(env):
     env['res.config.settings']._reset_light_color_assets()
     env['res.config.settings']._reset_dark_color_assets()
+    env['web_editor.assets']._remove_company_palettes()
+    env['ir.config_parameter'].sudo().search([
+        ('key', '=like', 'muk_web_colors.%')
+    ]).unlink()
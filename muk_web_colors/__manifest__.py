@@ -4,7 +4,7 @@
     'description': '''
         This module gives you options to customize the theme colors.
     ''',
-    'version': '17.0.1.0.5',
+    'version': '17.0.1.5.6',
     'category': 'Tools/UI',
     'license': 'LGPL-3', 
     'author': 'MuK IT',
@@ -18,6 +18,9 @@
         'web_editor',
     ],
     'data': [
+        'security/ir.model.access.csv',
+        'data/ir_cron.xml',
+        'data/web_editor_assets.xml',
         'templates/webclient.xml',
         'views/res_config_settings.xml',
     ],
@@ -0,0 +1,3 @@
+from . import binary
+from . import home
+from . import metrics
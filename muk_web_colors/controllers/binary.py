@@ -0,0 +1,21 @@
+from werkzeug.exceptions import NotFound
+
+from odoo import http
+from odoo.http import request
+
+from odoo.addons.web.controllers import binary
+
+
+class Binary(binary.Binary):
+    
+    @http.route([
+        '/web/assets/palette/<string:color_palette>/<string:unique>/<string:filename>',
+        '/web/assets/palette/<string:color_palette>/<int:website_id>/<string:unique>/<string:filename>',
+    ], type='http', auth='public')
+    def content_assets_palette(self, color_palette=None, website_id=None, **kwargs):
+        if not request.env['web_editor.assets'].sudo()._has_company_palette(color_palette):
+            raise NotFound()
+        assets_params = {'color_palette': color_palette}
+        if website_id:
+            assets_params['website_id'] = website_id
+        return self.content_assets(**kwargs, assets_params=assets_params)
@@ -0,0 +1,14 @@
+from odoo import http
+from odoo.http import request
+
+from odoo.addons.web.controllers import home
+
+
+class Home(home.Home):
+    
+    @http.route()
+    def web_client(self, s_action=None, **kw):
+        if request.session.uid and \
+                request.httprequest.cookies.get('color_scheme') == 'dark':
+            request.env['web_editor.assets'].sudo()._activate_dark_color_assets()
+        return super().web_client(s_action=s_action, **kw)
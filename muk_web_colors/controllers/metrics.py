@@ -0,0 +1,29 @@
+from werkzeug.exceptions import Forbidden
+
+from odoo import http
+from odoo.http import request
+
+from odoo.addons.muk_web_colors.tools.metrics import metrics
+
+
+class MetricsController(http.Controller):
+    
+    def _check_metrics_access(self):
+        if not request.env.user._is_admin():
+            raise Forbidden()
+    
+    @http.route('/muk_web_colors/metrics', type='json', auth='user')
+    def metrics(self, reset=False):
+        self._check_metrics_access()
+        snapshot = metrics.snapshot()
+        if reset:
+            metrics.reset()
+        return snapshot
+    
+    @http.route('/muk_web_colors/metrics/prometheus', type='http', auth='user')
+    def metrics_prometheus(self, **kwargs):
+        self._check_metrics_access()
+        return request.make_response(metrics.to_prometheus(), headers=[
+            ('Content-Type', 'text/plain; version=0.0.4; charset=utf-8'),
+            ('Cache-Control', 'no-store'),
+        ])
@@ -1,2 +1,8 @@
+from . import asset_generation
+from . import ir_asset
+from . import ir_attachment
+from . import ir_http
+from . import ir_qweb
+from . import res_company
 from . import res_config_settings
 from . import web_editor_assets
@@ -0,0 +1,49 @@
+from odoo import models, fields, api
+
+
+class AssetGeneration(models.Model):
+    
+    _name = 'muk_web_colors.asset.generation'
+    _description = 'Color Asset Generation'
+    _log_access = False
+    
+    _sql_constraints = [
+        ('bundle_unique', 'UNIQUE(bundle)', 'The bundle must be unique.'),
+    ]
+    
+    #----------------------------------------------------------
+    # Fields
+    #----------------------------------------------------------
+    
+    bundle = fields.Char(
+        string='Bundle',
+        required=True,
+    )
+    
+    generation = fields.Integer(
+        string='Generation',
+        default=0,
+    )
+    
+    #----------------------------------------------------------
+    # Functions
+    #----------------------------------------------------------
+    
+    @api.model
+    def _read_generations(self):
+        self.flush_model()
+        self.env.cr.execute("""
+            SELECT bundle, generation FROM muk_web_colors_asset_generation
+        """)
+        return dict(self.env.cr.fetchall())
+    
+    @api.model
+    def _increment_generations(self, bundles):
+        self.flush_model()
+        self.env.cr.execute("""
+            INSERT INTO muk_web_colors_asset_generation (bundle, generation)
+            SELECT bundle, 1 FROM unnest(%s::varchar[]) AS bundle
+            ON CONFLICT (bundle) DO UPDATE 
+            SET generation = muk_web_colors_asset_generation.generation + 1
+        """, [sorted(bundles)])
+        self.invalidate_model()
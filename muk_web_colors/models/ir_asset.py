@@ -0,0 +1,67 @@
+from odoo import models, fields
+
+
+class IrAsset(models.Model):
+    
+    _inherit = 'ir.asset'
+    
+    #----------------------------------------------------------
+    # Fields
+    #----------------------------------------------------------
+    
+    path = fields.Char(
+        index=True
+    )
+    
+    color_palette = fields.Char(
+        string='Color Palette',
+        index=True,
+        copy=False,
+    )
+    
+    #----------------------------------------------------------
+    # Functions
+    #----------------------------------------------------------
+    
+    def _get_asset_params(self):
+        params = super()._get_asset_params()
+        if self.env.company.color_palette:
+            params['color_palette'] = self.env.company.color_palette
+        return params
+    
+    def _get_asset_bundle_url(self, filename, unique, assets_params, ignore_params=False):
+        url = super()._get_asset_bundle_url(
+            filename, unique, assets_params, ignore_params=ignore_params
+        )
+        palette = assets_params.get('color_palette')
+        # only the stylesheets differ, the scripts are shared by all palettes
+        if palette and not ignore_params and filename.endswith('.css'):
+            url = url.replace('/web/assets/', (
+                self.env['web_editor.assets'].COLOR_COMPANY_PALETTE_ROUTE % palette
+            ), 1)
+        return url
+    
+    def _get_related_assets(self, domain, color_palette=None, color_generation=None, **kwargs):
+        assets = super()._get_related_assets(domain, **kwargs)
+        palette_assets = assets.filtered('color_palette')
+        if not palette_assets:
+            return assets
+        assets -= palette_assets
+        palette_assets = palette_assets.filtered(
+            lambda asset: asset.color_palette == color_palette
+        )
+        if palette_assets:
+            # the palette replaces the global color overrides
+            targets = set(palette_assets.mapped('target'))
+            assets = assets.filtered(lambda asset: not (
+                asset.directive == 'replace' and 
+                asset.target in targets and 
+                (asset.path or '').startswith('/_custom/')
+            ))
+            assets = (assets | palette_assets).sorted(
+                lambda asset: (asset.sequence, asset.id)
+            )
+        return assets
+    
+    def _get_active_addons_list(self, color_palette=None, color_generation=None, **kwargs):
+        return super()._get_active_addons_list(**kwargs)
@@ -0,0 +1,59 @@
+from odoo import models, api
+
+
+class IrAttachment(models.Model):
+    
+    _inherit = 'ir.attachment'
+    
+    #----------------------------------------------------------
+    # Helper
+    #----------------------------------------------------------
+    
+    def _has_colors_custom_url(self):
+        if not self.ids:
+            return False
+        assets = self.env['web_editor.assets']
+        self.flush_recordset(['url'])
+        self.env.cr.execute("""
+            SELECT 1 FROM ir_attachment 
+            WHERE id IN %s AND (url IN %s OR url LIKE %s)
+            LIMIT 1
+        """, [
+            tuple(self.ids), 
+            tuple(assets._get_color_custom_urls()),
+            assets.COLOR_COMPANY_PALETTE_URL.split('%s')[0].replace('_', '\\_') + '%',
+        ])
+        return bool(self.env.cr.fetchone())
+    
+    def _clear_colors_cache(self):
+        assets = self.env['web_editor.assets'].sudo()
+        assets._expire_bundles({assets.COLOR_OVERRIDES_GENERATION})
+
+    #----------------------------------------------------------
+    # ORM
+    #----------------------------------------------------------
+    
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        assets = self.env['web_editor.assets']
+        if any(assets._is_color_custom_url(vals.get('url')) for vals in vals_list):
+            records._clear_colors_cache()
+        return records
+    
+    def write(self, vals):
+        if 'url' not in vals:
+            return super().write(vals)
+        customized = (
+            self.env['web_editor.assets']._is_color_custom_url(vals['url']) or 
+            self._has_colors_custom_url()
+        )
+        res = super().write(vals)
+        if customized:
+            self._clear_colors_cache()
+        return res
+    
+    def unlink(self):
+        if self._has_colors_custom_url():
+            self._clear_colors_cache()
+        return super().unlink()
@@ -0,0 +1,15 @@
+from odoo import models
+
+from odoo.addons.muk_web_colors.tools.metrics import measure
+
+
+class IrHttp(models.AbstractModel):
+
+    _inherit = "ir.http"
+
+    #----------------------------------------------------------
+    # Helper
+    #----------------------------------------------------------
+    
+    def _measure_session_info(self, name):
+        return measure(self.env, name)
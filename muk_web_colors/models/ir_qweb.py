@@ -0,0 +1,51 @@
+from odoo import models
+
+
+class IrQWeb(models.AbstractModel):
+    
+    _inherit = 'ir.qweb'
+    
+    #----------------------------------------------------------
+    # Helper
+    #----------------------------------------------------------
+    
+    def _set_color_assets_params(self, bundle, index, args, kwargs):
+        if len(args) > index:
+            assets_params = args[index]
+        else:
+            assets_params = kwargs.get('assets_params')
+        if assets_params is None:
+            assets_params = self.env['ir.asset']._get_asset_params()
+        assets_params = dict(assets_params)
+        assets = self.env['web_editor.assets']
+        # other bundles are shared by all palettes
+        if assets_params.get('color_palette') and \
+                bundle not in assets._get_company_palette_bundles():
+            del assets_params['color_palette']
+        # the generation becomes part of the cache key of the bundle, so
+        # expiring it on one worker expires it on all workers
+        generation = assets._get_bundle_generation(bundle)
+        if generation:
+            assets_params['color_generation'] = generation
+        if len(args) > index:
+            args = list(args)
+            args[index] = assets_params
+        else:
+            kwargs = dict(kwargs, assets_params=assets_params)
+        return args, kwargs
+    
+    #----------------------------------------------------------
+    # Functions
+    #----------------------------------------------------------
+    
+    def _get_asset_bundle(self, bundle_name, *args, **kwargs):
+        args, kwargs = self._set_color_assets_params(
+            bundle_name, 4, args, kwargs
+        )
+        return super()._get_asset_bundle(bundle_name, *args, **kwargs)
+    
+    def _generate_asset_links_cache(self, bundle, *args, **kwargs):
+        args, kwargs = self._set_color_assets_params(
+            bundle, 3, args, kwargs
+        )
+        return super()._generate_asset_links_cache(bundle, *args, **kwargs)
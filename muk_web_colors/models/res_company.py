@@ -0,0 +1,16 @@
+from odoo import models, fields
+
+
+class ResCompany(models.Model):
+    
+    _inherit = 'res.company'
+    
+    #----------------------------------------------------------
+    # Fields
+    #----------------------------------------------------------
+    
+    color_palette = fields.Char(
+        string='Color Palette',
+        readonly=True,
+        copy=False,
+    )
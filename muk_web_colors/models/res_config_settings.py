@@ -92,19 +92,95 @@ class ResConfigSettings(models.TransientModel):
         string='Danger Dark Color'
     )
     
+    #----------------------------------------------------------
+    # Fields Assets
+    #----------------------------------------------------------
+    
+    color_assets_prebuild = fields.Boolean(
+        string='Prebuild Color Assets',
+        config_parameter='muk_web_colors.assets_prebuild',
+    )
+    
+    color_assets_prebuild_workers = fields.Integer(
+        string='Prebuild Workers',
+        config_parameter='muk_web_colors.prebuild_workers',
+        default=1,
+    )
+    
+    color_assets_prebuild_timeout = fields.Integer(
+        string='Prebuild Timeout',
+        config_parameter='muk_web_colors.prebuild_timeout',
+        default=600,
+    )
+    
+    color_assets_dark_pending = fields.Boolean(
+        string='Dark Assets Pending',
+        compute='_compute_color_assets_dark_state',
+    )
+    
+    color_company_palette = fields.Boolean(
+        string='Company Colors',
+    )
+    
+    color_metrics = fields.Boolean(
+        string='Color Metrics',
+        config_parameter='muk_web_colors.metrics',
+    )
+    
+    color_assets_prebuild_state = fields.Selection(
+        selection=[
+            ('queued', 'Queued'),
+            ('running', 'Running'),
+            ('done', 'Done'),
+            ('failed', 'Failed'),
+        ],
+        string='Prebuild State',
+        compute='_compute_color_assets_prebuild_state',
+    )
+    
+    color_assets_prebuild_date = fields.Datetime(
+        string='Prebuild Date',
+        compute='_compute_color_assets_prebuild_state',
+    )
+    
+    #----------------------------------------------------------
+    # Compute
+    #----------------------------------------------------------
+    
+    def _compute_color_assets_prebuild_state(self):
+        params = self.env['ir.config_parameter'].sudo()
+        state = params.get_param('muk_web_colors.assets_prebuild_state')
+        date = params.get_param('muk_web_colors.assets_prebuild_date')
+        for record in self:
+            record.color_assets_prebuild_state = state or False
+            record.color_assets_prebuild_date = date or False
+    
+    def _compute_color_assets_dark_state(self):
+        pending = self.env['ir.config_parameter'].sudo().get_param(
+            'muk_web_colors.dark_assets_pending'
+        )
+        for record in self:
+            record.color_assets_dark_pending = bool(pending)
+    
     #----------------------------------------------------------
     # Helper
     #----------------------------------------------------------
     
+    def _get_color_editor(self):
+        company = self.company_id or self.env.company
+        return self.env['web_editor.assets'].with_context(
+            color_palette=company.color_palette
+        )
+    
     def _get_light_color_values(self):
-        return self.env['web_editor.assets'].get_color_variables_values(
+        return self._get_color_editor().get_color_variables_values(
             self.COLOR_ASSET_LIGHT_URL, 
             self.COLOR_BUNDLE_LIGHT_NAME,
             self.COLOR_FIELDS
         )
         
     def _get_dark_color_values(self):
-        return self.env['web_editor.assets'].get_color_variables_values(
+        return self._get_color_editor().get_color_variables_values(
             self.COLOR_ASSET_DARK_URL, 
             self.COLOR_BUNDLE_DARK_NAME,
             self.COLOR_FIELDS
@@ -122,55 +198,78 @@ class ResConfigSettings(models.TransientModel):
             values[f'{var}_dark'] = value
         return values
     
-    def _detect_light_color_change(self):
-        colors = self._get_light_color_values()
-        return any(
-            self[f'{var}_light'] != val
-            for var, val in colors.items()
-        )
-        
-    def _detect_dark_color_change(self):
-        colors = self._get_dark_color_values()
-        return any(
-            self[f'{var}_dark'] != val
-            for var, val in colors.items()
-        )
-        
-    def _replace_light_color_values(self):
-        variables = [
+    def _get_light_color_variables(self):
+        return [
             {
                 'name': field, 
                 'value': self[f'{field}_light']
             }
             for field in self.COLOR_FIELDS
         ]
-        return self.env['web_editor.assets'].replace_color_variables_values(
-            self.COLOR_ASSET_LIGHT_URL, 
-            self.COLOR_BUNDLE_LIGHT_NAME,
-            variables
-        )
         
-    def _replace_dark_color_values(self):
-        variables = [
+    def _get_dark_color_variables(self):
+        return [
             {
                 'name': field, 
                 'value': self[f'{field}_dark']
             }
             for field in self.COLOR_FIELDS
         ]
-        return self.env['web_editor.assets'].replace_color_variables_values(
-            self.COLOR_ASSET_DARK_URL, 
-            self.COLOR_BUNDLE_DARK_NAME,
-            variables
+    
+    @api.model
+    def _get_color_assets(self):
+        return [
+            (
+                self.COLOR_ASSET_LIGHT_URL, 
+                self.COLOR_BUNDLE_LIGHT_NAME,
+                self.COLOR_FIELDS
+            ),
+            (
+                self.COLOR_ASSET_DARK_URL, 
+                self.COLOR_BUNDLE_DARK_NAME,
+                self.COLOR_FIELDS
+            ),
+        ]
+    
+    def _get_color_assets_variables(self):
+        return [
+            (
+                self.COLOR_ASSET_LIGHT_URL, 
+                self.COLOR_BUNDLE_LIGHT_NAME,
+                self._get_light_color_variables()
+            ),
+            (
+                self.COLOR_ASSET_DARK_URL, 
+                self.COLOR_BUNDLE_DARK_NAME,
+                self._get_dark_color_variables()
+            ),
+        ]
+    
+    def _reset_company_color_asset(self, url, bundle):
+        if not self.company_id.color_palette:
+            return False
+        self.env['web_editor.assets'].reset_company_palette_asset(
+            self.company_id, url, bundle
         )
+        return True
     
     def _reset_light_color_assets(self):
+        if self._reset_company_color_asset(
+            self.COLOR_ASSET_LIGHT_URL, 
+            self.COLOR_BUNDLE_LIGHT_NAME,
+        ):
+            return
         self.env['web_editor.assets'].reset_color_asset(
             self.COLOR_ASSET_LIGHT_URL, 
             self.COLOR_BUNDLE_LIGHT_NAME,
         )
         
     def _reset_dark_color_assets(self):
+        if self._reset_company_color_asset(
+            self.COLOR_ASSET_DARK_URL, 
+            self.COLOR_BUNDLE_DARK_NAME,
+        ):
+            return
         self.env['web_editor.assets'].reset_asset(
             self.COLOR_ASSET_DARK_URL, 
             self.COLOR_BUNDLE_DARK_NAME,
@@ -202,12 +301,22 @@ class ResConfigSettings(models.TransientModel):
         res = super().get_values()
         res = self._set_light_color_values(res)
         res = self._set_dark_color_values(res)
+        res['color_company_palette'] = bool(self.env.company.color_palette)
         return res
 
     def set_values(self):
         res = super().set_values()
-        if self._detect_light_color_change():
-            self._replace_light_color_values()
-        if self._detect_dark_color_change():
-            self._replace_dark_color_values()
+        assets = self.env['web_editor.assets']
+        if self.color_company_palette:
+            assets.replace_company_palette_values(
+                self.company_id, self._get_color_assets_variables()
+            )
+        elif self.company_id.color_palette:
+            # the form shows the company colors, they are dropped and
+            # must not overwrite the global colors
+            assets._save_company_palette(self.company_id, {})
+        else:
+            assets.replace_color_assets_values(
+                self._get_color_assets_variables()
+            )
         return res
@@ -1,34 +1,150 @@
-import re
+import os
+import zlib
+import json
+import time
 import base64
+import hashlib
+import logging
 
-from odoo import models, fields, api
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from odoo import models, fields, api, tools
+from odoo.modules.module import get_manifest
 from odoo.tools import misc
 
 from odoo.addons.base.models.assetsbundle import EXTENSIONS
+from odoo.addons.muk_web_colors.tools.scss import ScssVariables
+from odoo.addons.muk_web_colors.tools.metrics import count, observe, timed
+
+_logger = logging.getLogger(__name__)
 
 
 class ScssEditor(models.AbstractModel):
     
     _inherit = 'web_editor.assets'
 
+    # ----------------------------------------------------------
+    # Properties
+    # ----------------------------------------------------------
+
+    @property
+    def COLOR_PREBUILD_BUNDLES(self):
+        return [
+            'web.assets_backend',
+            'web.assets_web_dark',
+        ]
+
+    @property
+    def COLOR_DARK_BUNDLE(self):
+        return 'web.assets_web_dark'
+
+    @property
+    def COLOR_PALETTE_URL(self):
+        return '/muk_web_colors/palette/%s/%s/%s.min.css'
+
+    @property
+    def COLOR_COMPANY_PALETTE_URL(self):
+        return '/_custom/palette/%s/%s%s'
+
+    @property
+    def COLOR_COMPANY_PALETTE_ROUTE(self):
+        return '/web/assets/palette/%s/'
+
+    @property
+    def COLOR_OVERRIDES_GENERATION(self):
+        return 'muk_web_colors.overrides'
+
+    @property
+    def COLOR_SAVE_LOCK(self):
+        return zlib.crc32(b'muk_web_colors.save_color_assets')
+
     # ----------------------------------------------------------
     # Helper
     # ----------------------------------------------------------
 
     @api.model
-    def _get_colors_attachment(self, custom_url):
-        return self.env['ir.attachment'].search([
+    def _get_bundle_generations(self):
+        # read once per cursor, the generations are part of the cache keys
+        # so a change reaches every worker without clearing any cache
+        cache = self.env.cr.cache
+        if 'muk_web_colors.generations' not in cache:
+            cache['muk_web_colors.generations'] = tools.frozendict(
+                self.env['muk_web_colors.asset.generation'].sudo()._read_generations()
+            )
+        return cache['muk_web_colors.generations']
+
+    @api.model
+    def _get_color_custom_urls(self):
+        return frozenset(
+            self._make_custom_asset_url(url, bundle)
+            for url, bundle, variables in 
+            self.env['res.config.settings']._get_color_assets()
+        )
+
+    @api.model
+    def _is_color_custom_url(self, url):
+        return bool(url) and (
+            url in self._get_color_custom_urls() or 
+            url.startswith(self.COLOR_COMPANY_PALETTE_URL.split('%s')[0])
+        )
+
+    @api.model
+    def _get_bundle_generation(self, bundle):
+        return self._get_bundle_generations().get(bundle, 0)
+
+    @api.model
+    @timed('colors.expire_bundles')
+    def _expire_bundles(self, bundles):
+        if not bundles:
+            return
+        self.env['muk_web_colors.asset.generation'].sudo()._increment_generations(
+            bundles
+        )
+        self.env.cr.cache.pop('muk_web_colors.generations', None)
+        count(self.env, 'colors.bundles_expired', len(bundles))
+
+    @api.model
+    @tools.ormcache('custom_url', 'generation', cache='assets')
+    def _get_colors_attachment_ids(self, custom_url, generation):
+        return tuple(self.env['ir.attachment'].sudo().search([
             ('url', '=', custom_url)
-        ])
+        ]).ids)
+
+    @api.model
+    @tools.ormcache('custom_url', 'generation', cache='assets')
+    def _get_colors_asset_ids(self, custom_url, generation):
+        return tuple(self.env['ir.asset'].sudo().search([
+            ('path', '=', custom_url)
+        ]).ids)
+
+    @api.model
+    def _get_colors_attachment(self, custom_url):
+        return self.env['ir.attachment'].browse(
+            self._get_colors_attachment_ids(
+                custom_url, 
+                self._get_bundle_generation(self.COLOR_OVERRIDES_GENERATION)
+            )
+        )
 
     @api.model
     def _get_colors_asset(self, custom_url):
-        return self.env['ir.asset'].search([
-            ('path', 'like', custom_url)
-        ])
+        return self.env['ir.asset'].browse(
+            self._get_colors_asset_ids(
+                custom_url, 
+                self._get_bundle_generation(self.COLOR_OVERRIDES_GENERATION)
+            )
+        )
 
     @api.model
     def _get_colors_from_url(self, url, bundle):
+        palette = self.env.context.get('color_palette')
+        if palette:
+            attachment = self._get_company_palette_attachment(
+                palette, url, bundle
+            )
+            if attachment:
+                return attachment.raw
         custom_url = self._make_custom_asset_url(url, bundle)
         url_info = self._get_data_from_url(custom_url)
         if url_info['customized']:
@@ -40,82 +156,643 @@ class ScssEditor(models.AbstractModel):
         with misc.file_open(url.strip('/'), 'rb', filter_ext=EXTENSIONS) as f:
             return f.read()
 
-    def _get_color_variable(self, content, variable):
-        value = re.search(fr'\$mk_{variable}\:?\s(.*?);', content)
-        return value and value.group(1)
+    @api.model
+    def _get_colors_version(self, url, bundle):
+        palette = self.env.context.get('color_palette')
+        if palette:
+            attachment = self._get_company_palette_attachment(
+                palette, url, bundle
+            )
+            if attachment:
+                return attachment.checksum
+        custom_url = self._make_custom_asset_url(url, bundle)
+        url_info = self._get_data_from_url(custom_url)
+        if url_info['customized']:
+            attachment = self._get_colors_attachment(
+                custom_url
+            )
+            if attachment:
+                return attachment.checksum
+        return os.path.getmtime(
+            misc.file_path(url.strip('/'), filter_ext=EXTENSIONS)
+        )
+
+    @api.model
+    @tools.ormcache('url', 'bundle', 'variables', 'version', cache='assets')
+    def _get_color_variables_cached(self, url, bundle, variables, version):
+        count(self.env, 'colors.variables_cache_miss')
+        content = self._get_colors_from_url(url, bundle)
+        return tools.frozendict(self._get_color_variables(
+            content.decode('utf-8'), variables
+        ))
 
     def _get_color_variables(self, content, variables):
+        return ScssVariables(content).get_values(variables)
+
+    def _replace_color_variables(self, content, variables):
+        return ScssVariables(content).replace({
+            variable['name']: variable['value'] 
+            for variable in variables
+        })
+
+    @api.model
+    def _get_bundle_includes(self):
+        includes = defaultdict(set)
+        for addon in self.env['ir.asset']._get_installed_addons_list():
+            manifest = get_manifest(addon) or {}
+            for bundle, commands in manifest.get('assets', {}).items():
+                for command in commands:
+                    if isinstance(command, (list, tuple)) and command[0] == 'include':
+                        includes[command[1]].add(bundle)
+        include_assets = self.env['ir.asset'].sudo().search([
+            ('directive', '=', 'include'),
+        ])
+        for asset in include_assets:
+            includes[asset.path].add(asset.bundle)
+        return includes
+
+    @api.model
+    def _get_dependent_bundles(self, bundles):
+        includes = self._get_bundle_includes()
+        dependent_bundles = set(bundles)
+        bundles_to_check = list(bundles)
+        while bundles_to_check:
+            for parent in includes[bundles_to_check.pop()]:
+                if parent not in dependent_bundles:
+                    dependent_bundles.add(parent)
+                    bundles_to_check.append(parent)
+        return dependent_bundles
+
+    @api.model
+    @tools.ormcache(cache='assets')
+    def _get_company_palette_bundles(self):
+        return frozenset(self._get_dependent_bundles({
+            bundle for url, bundle, variables in 
+            self.env['res.config.settings']._get_color_assets()
+        }))
+
+    @api.model
+    def _get_dark_bundles(self):
+        return self._get_dependent_bundles({self.COLOR_DARK_BUNDLE})
+
+    @api.model
+    def _defer_dark_color_assets(self):
+        params = self.env['ir.config_parameter'].sudo()
+        params.set_param('muk_web_colors.dark_assets_pending', True)
+
+    @api.model
+    def _activate_dark_color_assets(self):
+        # the parameter is cached, only the first request after a change
+        # writes and the new generation reaches every worker
+        count(self.env, 'colors.dark_requests')
+        params = self.env['ir.config_parameter'].sudo()
+        if params.get_param('muk_web_colors.dark_assets_pending'):
+            count(self.env, 'colors.dark_activations')
+            dark_bundles = self._get_dark_bundles()
+            self._expire_bundles(dark_bundles)
+            params.set_param('muk_web_colors.dark_assets_pending', False)
+            _logger.info(
+                "Invalidated deferred dark asset bundles: %s",
+                ', '.join(sorted(dark_bundles))
+            )
+            self._refresh_color_assets([self.COLOR_DARK_BUNDLE])
+
+    @api.model
+    def _get_color_prebuild_bundles(self):
+        params = self.env['ir.config_parameter'].sudo()
+        if params.get_param('muk_web_colors.dark_assets_pending'):
+            return [
+                bundle for bundle in self.COLOR_PREBUILD_BUNDLES
+                if bundle != self.COLOR_DARK_BUNDLE
+            ]
+        return self.COLOR_PREBUILD_BUNDLES
+
+    @api.model
+    def _invalidate_color_bundles(self, bundles):
+        dependent_bundles = self._get_dependent_bundles(bundles)
+        # dark mode bundles are invalidated on the next dark mode request
+        dark_bundles = dependent_bundles & self._get_dark_bundles()
+        if dark_bundles:
+            self._defer_dark_color_assets()
+            dependent_bundles -= dark_bundles
+        self._expire_bundles(dependent_bundles)
+        _logger.info(
+            "Invalidated %s asset bundles: %s",
+            len(dependent_bundles), ', '.join(sorted(dependent_bundles))
+        )
+        return len(dependent_bundles)
+
+    @api.model
+    def _is_color_assets_prebuild(self):
+        return bool(self.env['ir.config_parameter'].sudo().get_param(
+            'muk_web_colors.assets_prebuild'
+        ))
+
+    @api.model
+    def _enqueue_color_assets_prebuild(self):
+        if not self._is_color_assets_prebuild():
+            return
+        params = self.env['ir.config_parameter'].sudo()
+        params.set_param('muk_web_colors.assets_prebuild_state', 'queued')
+        self.env.ref('muk_web_colors.ir_cron_prebuild_color_assets')._trigger()
+
+    @api.model
+    def _refresh_color_assets(self, bundles=None):
+        # only the prebuild fills the palette cache, without it there is
+        # nothing to apply and the bundles compile on their next request
+        if not self._is_color_assets_prebuild():
+            return False
+        if not self._apply_palette_css(bundles):
+            self._enqueue_color_assets_prebuild()
+        return True
+
+    @api.model
+    def _get_bundle_source_version(self, asset_bundle):
+        # the version of the bundle without the color overrides, cached
+        # palette CSS is only valid as long as the other sources are equal
+        custom_urls = self._get_color_custom_urls()
+        descriptors = [
+            getattr(asset, 'unique_descriptor', None) or 
+            '%s,%s' % (asset.url, asset.last_modified)
+            for asset in asset_bundle.stylesheets
+            if asset.url not in custom_urls
+        ]
+        return hashlib.sha1(
+            json.dumps(descriptors, default=str).encode()
+        ).hexdigest()[:16]
+
+    @api.model
+    def _get_color_asset_bundle(self, bundle, palette=None):
+        # the palette of the current company must not leak into the
+        # global bundles compiled in its request
+        assets_params = self.env['ir.asset']._get_asset_params()
+        assets_params.pop('color_palette', None)
+        if palette:
+            assets_params['color_palette'] = palette
+        return self.env['ir.qweb']._get_asset_bundle(
+            bundle, js=False, assets_params=assets_params
+        )
+
+    @api.model
+    def _compile_color_bundle(self, bundle, palette=None):
+        start = time.perf_counter()
+        asset_bundle = self._get_color_asset_bundle(bundle, palette)
+        attachments = asset_bundle.css()
+        content = attachments[0].raw if attachments else None
+        source = self._get_bundle_source_version(asset_bundle)
+        return content, source, time.perf_counter() - start
+
+    def _compile_color_bundle_with_cursor(self, bundle, palette=None):
+        with self.env.registry.cursor() as cr:
+            env = api.Environment(cr, self.env.uid, self.env.context)
+            return env['web_editor.assets']._compile_color_bundle(
+                bundle, palette
+            )
+
+    @api.model
+    def _compile_color_bundles(self, bundles, palette=None):
+        params = self.env['ir.config_parameter'].sudo()
+        workers = int(params.get_param('muk_web_colors.prebuild_workers', 1))
+        timeout = int(params.get_param('muk_web_colors.prebuild_timeout', 600))
+        if workers <= 1 or len(bundles) <= 1 or self.env.registry.in_test_mode():
+            return {
+                bundle: self._compile_color_bundle(bundle, palette)
+                for bundle in bundles
+            }
+        # each bundle is compiled in its own thread and transaction
+        executor = ThreadPoolExecutor(
+            max_workers=min(workers, len(bundles)),
+            thread_name_prefix='muk_web_colors',
+        )
+        try:
+            futures = {
+                bundle: executor.submit(
+                    self._compile_color_bundle_with_cursor, bundle, palette
+                )
+                for bundle in bundles
+            }
+            done, pending = wait(futures.values(), timeout=timeout or None)
+            if pending:
+                raise TimeoutError(
+                    "Compiling the color bundles exceeded %ss" % timeout
+                )
+            return {
+                bundle: future.result() 
+                for bundle, future in futures.items()
+            }
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @api.model
+    @timed('colors.prebuild')
+    def _prebuild_color_assets(self):
+        palette = self._get_color_palette_hash()
+        bundles = self._get_color_prebuild_bundles()
+        results = self._compile_color_bundles(bundles)
+        for bundle, (content, source, seconds) in results.items():
+            _logger.info("Compiled color bundle %s in %.2fs", bundle, seconds)
+            observe(self.env, 'colors.compile.%s' % bundle, seconds)
+            if content:
+                self._save_palette_css(palette, source, bundle, content)
+        self._gc_palette_css()
+        # company palettes are stored by the bundles themselves
+        for company_palette in self._get_company_palettes():
+            palette_results = self._compile_color_bundles(
+                bundles, company_palette
+            )
+            for bundle, (content, source, seconds) in palette_results.items():
+                _logger.info(
+                    "Compiled color bundle %s of palette %s in %.2fs", 
+                    bundle, company_palette, seconds
+                )
+                observe(self.env, 'colors.compile_palette.%s' % bundle, seconds)
         return {
-            var: self._get_color_variable(content, var) 
-            for var in variables
+            bundle: seconds 
+            for bundle, (content, source, seconds) in results.items()
         }
 
-    def _replace_color_variables(self, content, variables):
-        for variable in variables:
-            content = re.sub(
-                fr'{variable["name"]}\:?\s(.*?);', 
-                f'{variable["name"]}: {variable["value"]};', 
-                content
+    @api.model
+    def _get_color_palette_hash(self):
+        palette = []
+        color_assets = self.env['res.config.settings']._get_color_assets()
+        for url, bundle, variables in color_assets:
+            values = self.get_color_variables_values(url, bundle, variables)
+            palette.append([url, bundle, sorted(
+                (name, (value or '').strip().lower())
+                for name, value in values.items()
+            )])
+        return hashlib.sha1(json.dumps(palette).encode()).hexdigest()
+
+    @api.model
+    def _get_palette_css(self, palette, source, bundle):
+        return self.env['ir.attachment'].sudo().search([
+            ('url', '=', self.COLOR_PALETTE_URL % (palette, source, bundle))
+        ], limit=1)
+
+    @api.model
+    def _save_palette_css(self, palette, source, bundle, content):
+        attachment = self._get_palette_css(palette, source, bundle)
+        if attachment:
+            attachment.write({'raw': content})
+        else:
+            self.env['ir.attachment'].sudo().create({
+                'name': '%s.%s.min.css' % (bundle, palette),
+                'type': 'binary',
+                'mimetype': 'text/css',
+                'raw': content,
+                'url': self.COLOR_PALETTE_URL % (palette, source, bundle),
+                'description': palette,
+                'public': False,
+            })
+        # palettes compiled against other sources can never be applied again
+        self.env['ir.attachment'].sudo().search([
+            ('url', '=like', self.COLOR_PALETTE_URL % ('%', '%', bundle)),
+            ('url', 'not like', '/%s/%s.min.css' % (source, bundle)),
+        ]).unlink()
+
+    @api.model
+    def _gc_palette_css(self):
+        size = int(self.env['ir.config_parameter'].sudo().get_param(
+            'muk_web_colors.palette_cache_size', 10
+        ))
+        attachments = self.env['ir.attachment'].sudo().search([
+            ('url', '=like', self.COLOR_PALETTE_URL.split('%s')[0] + '%'),
+        ], order='write_date desc, id desc')
+        palettes = list(dict.fromkeys(attachments.mapped('description')))
+        expired = set(palettes[size:])
+        attachments.filtered(lambda a: a.description in expired).unlink()
+
+    @api.model
+    def _apply_palette_css(self, bundles=None):
+        palette = self._get_color_palette_hash()
+        asset_bundles = {
+            bundle: self._get_color_asset_bundle(bundle)
+            for bundle in bundles or self._get_color_prebuild_bundles()
+        }
+        cached_attachments = {
+            bundle: self._get_palette_css(
+                palette, self._get_bundle_source_version(asset_bundle), bundle
             )
-        return content
+            for bundle, asset_bundle in asset_bundles.items()
+        }
+        if not all(cached_attachments.values()):
+            return False
+        for bundle, cached_attachment in cached_attachments.items():
+            asset_bundle = asset_bundles[bundle]
+            if not asset_bundle.get_attachments('min.css'):
+                asset_bundle.save_attachment(
+                    'min.css', cached_attachment.raw.decode('utf-8')
+                )
+        # touch the cached palette to keep it in the cache
+        self.env['ir.attachment'].union(
+            *cached_attachments.values()
+        ).write({'description': palette})
+        _logger.info("Applied cached CSS of palette %s", palette)
+        return True
 
     @api.model
-    def _save_color_asset(self, url, bundle, content):
-        custom_url = self._make_custom_asset_url(url, bundle)
+    def _lock_color_assets(self):
+        # a save that has to wait for another one is retried with a new
+        # snapshot, otherwise it would not see the rows created meanwhile
+        self.env.cr.execute(
+            "SELECT pg_try_advisory_xact_lock(%s)", [self.COLOR_SAVE_LOCK]
+        )
+        if not self.env.cr.fetchone()[0]:
+            self.env.cr.execute("SET LOCAL lock_timeout = '1ms'")
+            self.env.cr.execute(
+                "SELECT pg_advisory_xact_lock(%s)", [self.COLOR_SAVE_LOCK]
+            )
+            self.env.cr.execute("SET LOCAL lock_timeout = DEFAULT")
+
+    @api.model
+    def _merge_color_duplicates(self, custom_urls=None):
+        if custom_urls is None:
+            custom_urls = list(self._get_color_custom_urls())
+        attachments = self.env['ir.attachment'].sudo().search([
+            ('url', 'in', custom_urls)
+        ], order='write_date desc, id desc')
+        assets = self.env['ir.asset'].sudo().search([
+            ('path', 'in', custom_urls)
+        ], order='write_date desc, id desc')
+        duplicate_attachments = attachments - attachments.browse({
+            attachment.url: attachment.id 
+            for attachment in reversed(attachments)
+        }.values())
+        duplicate_assets = assets - assets.browse({
+            asset.path: asset.id 
+            for asset in reversed(assets)
+        }.values())
+        if duplicate_attachments or duplicate_assets:
+            _logger.info(
+                "Removed %s duplicated color attachments and %s assets",
+                len(duplicate_attachments), len(duplicate_assets)
+            )
+            duplicate_attachments.unlink()
+            duplicate_assets.unlink()
+        return len(duplicate_attachments) + len(duplicate_assets)
+
+    @api.model
+    def _get_color_asset_values(self, url, bundle, path):
         asset_url = url[1:] if url.startswith(('/', '\\')) else url
-        datas = base64.b64encode((content or "\n").encode("utf-8"))
-        custom_attachment = self._get_colors_attachment(
-            custom_url
+        asset_values = {
+            'path': path,
+            'target': url,
+            'directive': 'replace',
+        }
+        target_asset = self._get_colors_asset(
+            asset_url
         )
-        if custom_attachment:
-            custom_attachment.write({"datas": datas})
-            self.env.registry.clear_cache('assets')
+        if target_asset:
+            asset_values['name'] = '%s override' % target_asset.name
+            asset_values['bundle'] = target_asset.bundle
+            asset_values['sequence'] = target_asset.sequence
         else:
-            attachment_values = {
+            asset_values['name'] = '%s: replace %s' % (
+                bundle, path.split('/')[-1]
+            )
+            asset_values['bundle'] = self.env['ir.asset']._get_related_bundle(
+                url, bundle
+            )
+        return asset_values
+
+    @api.model
+    @timed('colors.save_assets')
+    def _save_color_assets(self, assets):
+        self._lock_color_assets()
+        self._merge_color_duplicates([
+            self._make_custom_asset_url(url, bundle)
+            for url, bundle, content in assets
+        ])
+        attachment_values_list = []
+        asset_values_list = []
+        for url, bundle, content in assets:
+            custom_url = self._make_custom_asset_url(url, bundle)
+            datas = base64.b64encode((content or "\n").encode("utf-8"))
+            custom_attachment = self.env['ir.attachment'].search([
+                ('url', '=', custom_url)
+            ], limit=1)
+            if custom_attachment:
+                custom_attachment.write({"datas": datas})
+                continue
+            attachment_values_list.append({
                 'name': url.split("/")[-1],
                 'type': "binary",
                 'mimetype': 'text/scss',
                 'datas': datas,
                 'url': custom_url,
-            }
-            asset_values = {
-                'path': custom_url,
-                'target': url,
-                'directive': 'replace',
-            }
-            target_asset = self._get_colors_asset(
-                asset_url
-            )
-            if target_asset:
-                asset_values['name'] = '%s override' % target_asset.name
-                asset_values['bundle'] = target_asset.bundle
-                asset_values['sequence'] = target_asset.sequence
-            else:
-                asset_values['name'] = '%s: replace %s' % (
-                    bundle, custom_url.split('/')[-1]
-                )
-                asset_values['bundle'] = self.env['ir.asset']._get_related_bundle(
-                    url, bundle
-                )
-            self.env['ir.attachment'].create(attachment_values)
-            self.env['ir.asset'].create(asset_values)
+            })
+            asset_values_list.append(self._get_color_asset_values(
+                url, bundle, custom_url
+            ))
+        if attachment_values_list:
+            self.env['ir.attachment'].create(attachment_values_list)
+        if asset_values_list:
+            self.env['ir.asset'].create([
+                asset_values for asset_values in asset_values_list
+                if not self.env['ir.asset'].sudo().search_count([
+                    ('path', '=', asset_values['path'])
+                ], limit=1)
+            ])
+        invalidated = self._invalidate_color_bundles({
+            bundle for url, bundle, content in assets
+        })
+        self._refresh_color_assets()
+        return invalidated
+
+    @api.model
+    def _save_color_asset(self, url, bundle, content):
+        return self._save_color_assets([(url, bundle, content)])
+
+    @api.model
+    def _make_company_palette_url(self, palette, url, bundle):
+        return self.COLOR_COMPANY_PALETTE_URL % (palette, bundle, url)
+
+    @api.model
+    def _get_company_palette_attachment(self, palette, url, bundle):
+        return self.env['ir.attachment'].sudo().search([
+            ('url', '=', self._make_company_palette_url(palette, url, bundle))
+        ], limit=1)
+
+    @api.model
+    def _has_company_palette(self, palette):
+        return bool(palette) and bool(self.env['ir.asset'].sudo().search_count([
+            ('color_palette', '=', palette)
+        ], limit=1))
+
+    @api.model
+    def _get_company_palettes(self):
+        companies = self.env['res.company'].sudo().with_context(
+            active_test=False
+        ).search([('color_palette', '!=', False)])
+        return sorted(set(companies.mapped('color_palette')))
+
+    @api.model
+    def _get_company_palette_contents(self, palette):
+        contents = {}
+        if not palette:
+            return contents
+        color_assets = self.env['res.config.settings']._get_color_assets()
+        for url, bundle, variables in color_assets:
+            attachment = self._get_company_palette_attachment(
+                palette, url, bundle
+            )
+            if attachment:
+                contents[(url, bundle)] = attachment.raw.decode('utf-8')
+        return contents
+
+    @api.model
+    def _save_company_palette(self, company, contents):
+        # palettes are addressed by their content, companies with the
+        # same colors share the assets and the compiled bundles
+        self._lock_color_assets()
+        palette = False
+        if contents:
+            palette = hashlib.sha1(json.dumps(sorted(
+                [url, bundle, content] 
+                for (url, bundle), content in contents.items()
+            )).encode()).hexdigest()[:16]
+        if palette and not self._has_company_palette(palette):
+            self.env['ir.attachment'].sudo().create([
+                {
+                    'name': url.split("/")[-1],
+                    'type': "binary",
+                    'mimetype': 'text/scss',
+                    'raw': (content or "\n").encode('utf-8'),
+                    'url': self._make_company_palette_url(palette, url, bundle),
+                }
+                for (url, bundle), content in contents.items()
+            ])
+            self.env['ir.asset'].sudo().create([
+                dict(self._get_color_asset_values(
+                    url, bundle, 
+                    self._make_company_palette_url(palette, url, bundle)
+                ), color_palette=palette)
+                for (url, bundle), content in contents.items()
+            ])
+        company.sudo().color_palette = palette
+        self._gc_company_palettes()
+        if palette:
+            self._enqueue_color_assets_prebuild()
+        return palette
+
+    @api.model
+    def _gc_company_palettes(self):
+        palettes = self._get_company_palettes()
+        assets = self.env['ir.asset'].sudo().search([
+            ('color_palette', '!=', False),
+            ('color_palette', 'not in', palettes),
+        ])
+        if not assets:
+            return 0
+        expired = set(assets.mapped('color_palette'))
+        self.env['ir.attachment'].sudo().search([
+            ('url', 'in', assets.mapped('path'))
+        ]).unlink()
+        for palette in expired:
+            self.env['ir.attachment'].sudo().search([
+                ('url', '=like', '%s%%' % (
+                    self.COLOR_COMPANY_PALETTE_ROUTE % palette
+                )),
+            ]).unlink()
+        assets.unlink()
+        _logger.info("Removed unused color palettes: %s", ', '.join(sorted(expired)))
+        return len(expired)
+
+    @api.model
+    def _remove_company_palettes(self):
+        # palette overrides left behind would replace the color files for
+        # every company once the palette filter of ir.asset is gone
+        self.env['res.company'].sudo().with_context(active_test=False).search([
+            ('color_palette', '!=', False)
+        ]).write({'color_palette': False})
+        self._gc_company_palettes()
+        self.env['ir.asset'].sudo().search([
+            ('path', '=like', self.COLOR_COMPANY_PALETTE_URL.split('%s')[0] + '%'),
+        ]).unlink()
+        self.env['ir.attachment'].sudo().search([
+            '|', '|',
+            ('url', '=like', self.COLOR_COMPANY_PALETTE_URL.split('%s')[0] + '%'),
+            ('url', '=like', self.COLOR_COMPANY_PALETTE_ROUTE.split('%s')[0] + '%'),
+            ('url', '=like', self.COLOR_PALETTE_URL.split('%s')[0] + '%'),
+        ]).unlink()
 
     # ----------------------------------------------------------
     # Functions
     # ----------------------------------------------------------
 
+    @timed('colors.get_variables')
     def get_color_variables_values(self, url, bundle, variables):
-        content = self._get_colors_from_url(url, bundle)
-        return self._get_color_variables(
-            content.decode('utf-8'), variables
-        )
+        return dict(self._get_color_variables_cached(
+            url, bundle, tuple(variables),
+            self._get_colors_version(url, bundle)
+        ))
     
+    @timed('colors.replace_variables')
     def replace_color_variables_values(self, url, bundle, variables):
         original = self._get_colors_from_url(url, bundle).decode('utf-8')
         content = self._replace_color_variables(original, variables)
-        self._save_color_asset(url, bundle, content)
+        return self._save_color_asset(url, bundle, content)
+
+    @timed('colors.replace_variables')
+    def replace_color_assets_values(self, assets):
+        changes = []
+        for url, bundle, variables in assets:
+            original = self._get_colors_from_url(url, bundle).decode('utf-8')
+            content = self._replace_color_variables(original, variables)
+            if content != original:
+                changes.append((url, bundle, content))
+        if not changes:
+            return 0
+        return self._save_color_assets(changes)
+
+    @timed('colors.save_palette')
+    def replace_company_palette_values(self, company, assets):
+        palette = company.color_palette
+        contents = self._get_company_palette_contents(palette)
+        for url, bundle, variables in assets:
+            original = self.with_context(color_palette=palette)._get_colors_from_url(
+                url, bundle
+            ).decode('utf-8')
+            contents[(url, bundle)] = self._replace_color_variables(
+                original, variables
+            )
+        return self._save_company_palette(company, contents)
+
+    def reset_company_palette_asset(self, company, url, bundle):
+        contents = self._get_company_palette_contents(company.color_palette)
+        contents.pop((url, bundle), None)
+        return self._save_company_palette(company, contents)
 
     def reset_color_asset(self, url, bundle):
+        self._lock_color_assets()
         custom_url = self._make_custom_asset_url(url, bundle)
-        self._get_colors_attachment(custom_url).unlink()
-        self._get_colors_asset(custom_url).unlink()
+        self.env['ir.attachment'].search([('url', '=', custom_url)]).unlink()
+        self.env['ir.asset'].search([('path', '=', custom_url)]).unlink()
+        invalidated = self._invalidate_color_bundles({bundle})
+        self._refresh_color_assets()
+        return invalidated
+
+    # ----------------------------------------------------------
+    # Cron
+    # ----------------------------------------------------------
+
+    @api.model
+    def _cron_prebuild_color_assets(self):
+        params = self.env['ir.config_parameter'].sudo()
+        state = params.get_param('muk_web_colors.assets_prebuild_state')
+        if state != 'queued':
+            return
+        params.set_param('muk_web_colors.assets_prebuild_state', 'running')
+        self.env.cr.commit()
+        try:
+            self._prebuild_color_assets()
+        except Exception:
+            _logger.exception("Prebuilding the color assets failed")
+            self.env.cr.rollback()
+            params.set_param('muk_web_colors.assets_prebuild_state', 'failed')
+        else:
+            params.set_param('muk_web_colors.assets_prebuild_state', 'done')
+        params.set_param(
+            'muk_web_colors.assets_prebuild_date', 
+            fields.Datetime.to_string(fields.Datetime.now())
+        )
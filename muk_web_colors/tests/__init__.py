@@ -0,0 +1,2 @@
+from . import test_color_assets
+from . import test_scss
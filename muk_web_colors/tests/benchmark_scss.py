@@ -0,0 +1,81 @@
+""" Compares the single pass SCSS parser with the previous regex loop.
+
+    The script is not part of the test suite and can be run without an
+    Odoo environment:
+
+        python muk_web_colors/tests/benchmark_scss.py [declarations] [variables]
+"""
+
+import importlib.util
+import os
+import re
+import sys
+import timeit
+
+try:
+    from odoo.addons.muk_web_colors.tools.scss import ScssVariables
+except ImportError:
+    spec = importlib.util.spec_from_file_location('scss', os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        'tools', 'scss.py'
+    ))
+    scss = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(scss)
+    ScssVariables = scss.ScssVariables
+
+
+#----------------------------------------------------------
+# Helper
+#----------------------------------------------------------
+
+def regex_get_values(content, names):
+    values = {}
+    for name in names:
+        value = re.search(fr'\$mk_{name}\:?\s(.*?);', content)
+        values[name] = value and value.group(1)
+    return values
+
+
+def regex_replace(content, values):
+    for name, value in values.items():
+        content = re.sub(
+            fr'{name}\:?\s(.*?);', f'{name}: {value};', content
+        )
+    return content
+
+
+def scss_get_values(content, names):
+    return ScssVariables(content).get_values(names)
+
+
+def scss_replace(content, values):
+    return ScssVariables(content).replace(values)
+
+
+#----------------------------------------------------------
+# Benchmark
+#----------------------------------------------------------
+
+def benchmark(declarations=5000, variables=100, number=20):
+    content = ''.join(
+        f'// Color {index}\n$mk_color_{index}: #{index:06X};\n'
+        for index in range(declarations)
+    )
+    step = max(declarations // variables, 1)
+    names = [f'color_{index}' for index in range(0, declarations, step)]
+    values = {name: '#000000' for name in names}
+    assert scss_get_values(content, names) == regex_get_values(content, names)
+    assert scss_replace(content, values) == regex_replace(content, values)
+    print(f'{declarations} declarations, {len(names)} variables')
+    for label, func, args in [
+        ('regex get_values', regex_get_values, names),
+        ('scss  get_values', scss_get_values, names),
+        ('regex replace', regex_replace, values),
+        ('scss  replace', scss_replace, values),
+    ]:
+        seconds = timeit.timeit(lambda: func(content, args), number=number)
+        print(f'{label:<18} {seconds / number * 1000:8.2f} ms')
+
+
+if __name__ == '__main__':
+    benchmark(*map(int, sys.argv[1:3]))
@@ -0,0 +1,89 @@
+import threading
+
+from odoo import api, SUPERUSER_ID
+from odoo.service.model import retrying
+from odoo.sql_db import db_connect
+from odoo.tests import common, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestColorAssetsConcurrency(common.TransactionCase):
+    
+    """ Saves the same color asset from several transactions at once.
+    
+        The saves run on their own connections and commit, like parallel
+        requests. A save that cannot get the lock fails with
+        LOCK_NOT_AVAILABLE and is retried the same way as an RPC call.
+    """
+
+    def setUp(self):
+        super().setUp()
+        settings = self.env['res.config.settings']
+        self.url = settings.COLOR_ASSET_LIGHT_URL
+        self.bundle = settings.COLOR_BUNDLE_LIGHT_NAME
+        self.custom_url = self.env['web_editor.assets']._make_custom_asset_url(
+            self.url, self.bundle
+        )
+        self.addCleanup(self._run, lambda env: (
+            env['web_editor.assets'].reset_color_asset(self.url, self.bundle)
+        ))
+
+    def _run(self, func):
+        with db_connect(self.env.cr.dbname).cursor() as cr:
+            env = api.Environment(cr, SUPERUSER_ID, {})
+            return retrying(lambda: func(env), env)
+
+    def _save_brand_color(self, value):
+        return self._run(lambda env: (
+            env['web_editor.assets'].replace_color_variables_values(
+                self.url, self.bundle, [{'name': 'color_brand', 'value': value}]
+            )
+        ))
+
+    def _read_color_rows(self):
+        def read(env):
+            attachments = env['ir.attachment'].sudo().search([
+                ('url', '=', self.custom_url)
+            ])
+            assets = env['ir.asset'].sudo().search([
+                ('path', '=', self.custom_url)
+            ])
+            return len(attachments), len(assets), (
+                attachments[:1].raw or b''
+            ).decode('utf-8')
+        return self._run(read)
+
+    def test_concurrent_saves(self):
+        values = ['#1%05x' % index for index in range(6)]
+        barrier = threading.Barrier(len(values))
+        errors = []
+        
+        def save(value):
+            try:
+                barrier.wait(timeout=30)
+                self._save_brand_color(value)
+            except Exception as error:
+                errors.append(error)
+        
+        threads = [
+            threading.Thread(target=save, args=(value,)) 
+            for value in values
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=120)
+        self.assertFalse(errors)
+        self.assertFalse(any(thread.is_alive() for thread in threads))
+        
+        attachments, assets, content = self._read_color_rows()
+        self.assertEqual(attachments, 1)
+        self.assertEqual(assets, 1)
+        self.assertEqual(sum(value in content for value in values), 1)
+        
+        self._save_brand_color('#123456')
+        attachments, assets, content = self._read_color_rows()
+        self.assertEqual(attachments, 1)
+        self.assertEqual(assets, 1)
+        self.assertIn('#123456', content)
+        self.assertFalse(any(value in content for value in values))
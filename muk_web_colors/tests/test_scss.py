@@ -0,0 +1,80 @@
+from odoo.tests import common, tagged
+from odoo.tools import file_open
+
+from odoo.addons.muk_web_colors.tools.scss import ScssVariables
+
+
+COLOR_FILES = [
+    'muk_web_colors/static/src/scss/colors_light.scss',
+    'muk_web_colors/static/src/scss/colors_dark.scss',
+]
+
+COLOR_VARIABLES = [
+    'color_brand',
+    'color_primary',
+    'color_success',
+    'color_info',
+    'color_warning',
+    'color_danger',
+]
+
+
+@tagged('post_install', '-at_install')
+class TestScssVariables(common.BaseCase):
+
+    """ Runs the SCSS parser on the color files shipped with the module. """
+
+    def _read(self, path):
+        with file_open(path) as file:
+            return file.read()
+
+    def test_get_values(self):
+        for path in COLOR_FILES:
+            with self.subTest(path=path):
+                variables = ScssVariables(self._read(path))
+                self.assertEqual(
+                    [declaration[0] for declaration in variables.declarations],
+                    COLOR_VARIABLES
+                )
+                values = variables.get_values(COLOR_VARIABLES)
+                for name, value in values.items():
+                    self.assertRegex(value, r'^#[0-9A-Fa-f]{6}$', name)
+                self.assertEqual(values['color_brand'], '#243742')
+                self.assertNotIn('mk-color-brand', variables)
+                self.assertIsNone(variables.get('color_missing'))
+
+    def test_replace_keeps_content(self):
+        for path in COLOR_FILES:
+            with self.subTest(path=path):
+                content = self._read(path)
+                variables = ScssVariables(content)
+                value = variables.get('color_primary')
+                result = variables.replace({'color_primary': '#000000'})
+                self.assertEqual(
+                    result, content.replace(
+                        f'$mk_color_primary: {value};',
+                        '$mk_color_primary: #000000;',
+                    )
+                )
+                self.assertIs(variables.replace({}), content)
+                self.assertIs(
+                    variables.replace({'color_primary': value}), content
+                )
+
+    def test_replace_round_trip(self):
+        for path in COLOR_FILES:
+            with self.subTest(path=path):
+                content = self._read(path)
+                original = ScssVariables(content).get_values(COLOR_VARIABLES)
+                values = {
+                    name: f'#{index:06X}'
+                    for index, name in enumerate(COLOR_VARIABLES, 1)
+                }
+                replaced = ScssVariables(content).replace(values)
+                self.assertEqual(
+                    ScssVariables(replaced).get_values(COLOR_VARIABLES),
+                    values
+                )
+                self.assertEqual(
+                    ScssVariables(replaced).replace(original), content
+                )
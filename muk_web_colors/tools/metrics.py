@@ -0,0 +1,149 @@
+import os
+import re
+import time
+import bisect
+import functools
+import threading
+import contextlib
+
+from collections import defaultdict
+
+
+METRICS_PARAM = 'muk_web_colors.metrics'
+
+HISTOGRAM_BUCKETS = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10
+)
+
+
+class Metrics:
+
+    """ Process local counters and duration histograms.
+    
+        Every worker process keeps its own values, which are labeled
+        with the process id so that a scraper can tell them apart.
+    """
+
+    def __init__(self, buckets=HISTOGRAM_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.pid = os.getpid()
+            self.started = time.time()
+            self.counters = defaultdict(int)
+            self.histograms = {}
+
+    def _check_pid(self):
+        # values inherited from the parent process before a fork
+        if self.pid != os.getpid():
+            self.reset()
+
+    def increment(self, name, value=1):
+        self._check_pid()
+        with self.lock:
+            self.counters[name] += value
+
+    def observe(self, name, seconds):
+        index = bisect.bisect_left(self.buckets, seconds)
+        self._check_pid()
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = {
+                    'buckets': [0] * (len(self.buckets) + 1),
+                    'count': 0,
+                    'sum': 0.0,
+                }
+            histogram['buckets'][index] += 1
+            histogram['count'] += 1
+            histogram['sum'] += seconds
+
+    def snapshot(self):
+        self._check_pid()
+        with self.lock:
+            return {
+                'pid': self.pid,
+                'started': self.started,
+                'counters': dict(self.counters),
+                'histograms': {
+                    name: {
+                        'buckets': dict(zip(
+                            [*map(str, self.buckets), '+Inf'],
+                            histogram['buckets'],
+                        )),
+                        'count': histogram['count'],
+                        'sum': histogram['sum'],
+                    }
+                    for name, histogram in self.histograms.items()
+                },
+            }
+
+    def to_prometheus(self, prefix='muk'):
+        lines = []
+        snapshot = self.snapshot()
+        pid = f'pid="{snapshot["pid"]}"'
+        metric = _metric_name(prefix, 'process_start_time', 'seconds')
+        lines.append(f'# TYPE {metric} gauge')
+        lines.append(f'{metric}{{{pid}}} {snapshot["started"]}')
+        for name, value in sorted(snapshot['counters'].items()):
+            metric = _metric_name(prefix, name, 'total')
+            lines.append(f'# TYPE {metric} counter')
+            lines.append(f'{metric}{{{pid}}} {value}')
+        for name, histogram in sorted(snapshot['histograms'].items()):
+            metric = _metric_name(prefix, name, 'seconds')
+            lines.append(f'# TYPE {metric} histogram')
+            cumulative = 0
+            for bound, count in histogram['buckets'].items():
+                cumulative += count
+                lines.append(
+                    f'{metric}_bucket{{{pid},le="{bound}"}} {cumulative}'
+                )
+            lines.append(f'{metric}_sum{{{pid}}} {histogram["sum"]}')
+            lines.append(f'{metric}_count{{{pid}}} {histogram["count"]}')
+        return '\n'.join(lines) + '\n'
+
+
+def _metric_name(prefix, name, suffix):
+    return re.sub(r'[^a-zA-Z0-9_]', '_', f'{prefix}_{name}_{suffix}')
+
+
+metrics = Metrics()
+
+
+def is_enabled(env):
+    return bool(env['ir.config_parameter'].sudo().get_param(METRICS_PARAM))
+
+
+@contextlib.contextmanager
+def measure(env, name):
+    if not is_enabled(env):
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.observe(name, time.perf_counter() - start)
+
+
+def observe(env, name, seconds):
+    if is_enabled(env):
+        metrics.observe(name, seconds)
+
+
+def count(env, name, value=1):
+    if is_enabled(env):
+        metrics.increment(name, value)
+
+
+def timed(name):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            with measure(self.env, name):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
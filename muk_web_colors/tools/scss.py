@@ -0,0 +1,57 @@
+import re
+
+
+VARIABLE_REGEX = re.compile(
+    r'^(?P<prefix>[ \t]*\$mk_(?P<name>[\w-]+)[ \t]*:?[ \t]+)'
+    r'(?P<value>[^;\n]*?)(?P<suffix>[ \t]*;)',
+    re.MULTILINE
+)
+
+
+class ScssVariables:
+    
+    """ Parses the `$mk_*` declarations of a SCSS file in a single pass
+        and keeps their positions to rewrite the values without touching
+        the rest of the content.
+    """
+
+    def __init__(self, content):
+        self.content = content
+        self.declarations = []
+        self.index = {}
+        for match in VARIABLE_REGEX.finditer(content):
+            self.index.setdefault(match['name'], len(self.declarations))
+            self.declarations.append((
+                match['name'], 
+                match['value'], 
+                match.start('value'), 
+                match.end('value'),
+            ))
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def get(self, name, default=None):
+        if name not in self.index:
+            return default
+        return self.declarations[self.index[name]][1]
+
+    def get_values(self, names):
+        return {
+            name: self.get(name) 
+            for name in names
+        }
+
+    def replace(self, values):
+        parts = []
+        position = 0
+        for name, value, start, end in self.declarations:
+            if name not in values or values[name] == value:
+                continue
+            parts.append(self.content[position:start])
+            parts.append(str(values[name]))
+            position = end
+        if not parts:
+            return self.content
+        parts.append(self.content[position:])
+        return ''.join(parts)
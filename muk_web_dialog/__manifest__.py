@@ -5,7 +5,7 @@
         This module adds an option to dialogs to expand it to full screen mode.
         Each user can the initial state of the dialogs in their preferences.
     ''',
-    'version': '17.0.1.0.0', 
+    'version': '17.0.1.1.3', 
     'category': 'Tools/UI',
     'license': 'LGPL-3', 
     'author': 'MuK IT',
@@ -12,5 +12,7 @@ class IrHttp(models.AbstractModel):
     
     def session_info(self):
         result = super(IrHttp, self).session_info()
-        result['dialog_size'] = self.env.user.dialog_size
+        result.setdefault('ui_preferences', {}).update({
+            'dialog_size': self.env.user.dialog_size,
+        })
         return result
@@ -9,7 +9,7 @@ patch(Dialog.prototype, {
 	setup() {
         super.setup();
         this.data.size = (
-    		session.dialog_size !== 'maximize' ? this.props.size : 'fs'
+    		session.ui_preferences?.dialog_size !== 'maximize' ? this.props.size : 'fs'
         );
         this.data.initalSize = this.props?.size || 'lg';
     }
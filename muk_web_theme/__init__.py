@@ -1,4 +1,5 @@
 from . import models
+from . import controllers
 
 import base64
 
@@ -19,3 +20,4 @@ def _setup_module(env):
 
 def _uninstall_cleanup(env):
     env['res.config.settings']._reset_theme_color_assets()
+    env['web_editor.assets']._remove_company_palettes()
@@ -5,7 +5,7 @@
         This module offers a mobile compatible design for Odoo Community. 
         Furthermore it allows the user to define some design preferences.
     ''',
-    'version': '17.0.1.2.1',
+    'version': '17.0.1.5.7',
     'category': 'Themes/Backend', 
     'license': 'LGPL-3', 
     'author': 'MuK IT',
@@ -24,6 +24,7 @@
         'web_enterprise',
     ],
     'data': [
+        'data/res_company.xml',
         'templates/web_layout.xml',
         'views/res_config_settings.xml',
     ],
@@ -0,0 +1,25 @@
+from odoo import http
+from odoo.http import request
+
+
+class FaviconController(http.Controller):
+    
+    @http.route([
+        '/web/favicon/<int:company_id>',
+        '/web/favicon/<int:company_id>/<int:size>',
+    ], type='http', auth='public')
+    def favicon(self, company_id, size=None, unique=None, **kwargs):
+        companies = request.env['res.company'].sudo()
+        field = f'favicon_png_{size}' if size else 'favicon_ico'
+        if field not in companies.FAVICON_VARIANTS or \
+                not companies._get_session_image_unique(company_id, field):
+            return request.redirect('/web/static/img/favicon.ico')
+        output_format = companies.FAVICON_VARIANTS[field][0]
+        stream = request.env['ir.binary']._get_stream_from(
+            companies.browse(company_id), field, 
+            mimetype='image/x-icon' if output_format == 'ICO' else 'image/png',
+        )
+        return stream.get_response(
+            immutable=bool(unique), 
+            max_age=http.STATIC_CACHE_LONG if unique else None,
+        )
@@ -13,8 +13,23 @@ class IrHttp(models.AbstractModel):
     def session_info(self):
         result = super(IrHttp, self).session_info()
         if request.env.user._is_internal():
-            for company in request.env.user.company_ids.with_context(bin_size=True):
-                result['user_companies']['allowed_companies'][company.id].update({
-                    'has_background_image': bool(company.background_image),
-                })
+            with self._measure_session_info('theme.session_info'):
+                companies = request.env['res.company'].sudo()
+                allowed_companies = result['user_companies']['allowed_companies']
+                for company_id, company in allowed_companies.items():
+                    unique = companies._get_session_image_unique(
+                        company_id, 'background_image'
+                    )
+                    company.update({
+                        'has_background_image': bool(unique),
+                        'background_image_unique': unique,
+                        'background_image_variants': (
+                            companies._get_background_image_variants(company_id)
+                        ),
+                        'background_image_placeholder_unique': (
+                            companies._get_session_image_unique(
+                                company_id, 'background_image_placeholder'
+                            )
+                        ),
+                    })
         return result
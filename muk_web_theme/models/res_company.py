@@ -1,10 +1,62 @@
-from odoo import models, fields
+import re
+import base64
+import logging
+
+from odoo import models, fields, api
+from odoo.exceptions import UserError
+from odoo.tools import image_process
+from odoo.tools.mimetypes import guess_mimetype
+
+_logger = logging.getLogger(__name__)
+
+COLOR_VALUE_REGEX = re.compile(
+    r'^(#[0-9a-fA-F]{3,8}|[a-zA-Z]+|(rgb|rgba|hsl|hsla)\([0-9a-zA-Z.,%/ ]+\))$'
+)
 
 
 class ResCompany(models.Model):
     
     _inherit = 'res.company'
     
+    #----------------------------------------------------------
+    # Properties
+    #----------------------------------------------------------
+    
+    @property
+    def FAVICON_VARIANTS(self):
+        return {
+            'favicon_ico': ('ICO', 32),
+            'favicon_png_16': ('PNG', 16),
+            'favicon_png_32': ('PNG', 32),
+            'favicon_png_180': ('PNG', 180),
+            'favicon_png_192': ('PNG', 192),
+        }
+    
+    @property
+    def BACKGROUND_IMAGE_VARIANTS(self):
+        return {
+            'background_image_768': 768,
+            'background_image_1280': 1280,
+            'background_image_1920': 1920,
+            'background_image_placeholder': 32,
+        }
+    
+    @property
+    def THEME_COLOR_FIELDS(self):
+        return [
+            'theme_color_appsmenu_text',
+            'theme_color_appbar_text',
+            'theme_color_appbar_active',
+            'theme_color_appbar_background',
+        ]
+    
+    @property
+    def SESSION_IMAGE_FIELDS(self):
+        return super().SESSION_IMAGE_FIELDS + [
+            'background_image',
+            'favicon',
+        ] + list(self.FAVICON_VARIANTS) + list(self.BACKGROUND_IMAGE_VARIANTS)
+    
     #----------------------------------------------------------
     # Fields
     #----------------------------------------------------------
@@ -14,7 +66,209 @@ class ResCompany(models.Model):
         attachment=True
     )
     
+    favicon_ico = fields.Binary(
+        string="Company Favicon ICO", 
+        compute='_compute_favicon_variants',
+        attachment=True,
+        store=True,
+    )
+    
+    favicon_png_16 = fields.Binary(
+        string="Company Favicon 16px", 
+        compute='_compute_favicon_variants',
+        attachment=True,
+        store=True,
+    )
+    
+    favicon_png_32 = fields.Binary(
+        string="Company Favicon 32px", 
+        compute='_compute_favicon_variants',
+        attachment=True,
+        store=True,
+    )
+    
+    favicon_png_180 = fields.Binary(
+        string="Company Favicon 180px", 
+        compute='_compute_favicon_variants',
+        attachment=True,
+        store=True,
+    )
+    
+    favicon_png_192 = fields.Binary(
+        string="Company Favicon 192px", 
+        compute='_compute_favicon_variants',
+        attachment=True,
+        store=True,
+    )
+    
     background_image = fields.Binary(
         string='Apps Menu Background Image',
         attachment=True
     )
+    
+    background_image_768 = fields.Binary(
+        string='Apps Menu Background Image 768px',
+        compute='_compute_background_image_variants',
+        attachment=True,
+        store=True,
+    )
+    
+    background_image_1280 = fields.Binary(
+        string='Apps Menu Background Image 1280px',
+        compute='_compute_background_image_variants',
+        attachment=True,
+        store=True,
+    )
+    
+    background_image_1920 = fields.Binary(
+        string='Apps Menu Background Image 1920px',
+        compute='_compute_background_image_variants',
+        attachment=True,
+        store=True,
+    )
+    
+    background_image_placeholder = fields.Binary(
+        string='Apps Menu Background Image Placeholder',
+        compute='_compute_background_image_variants',
+        attachment=True,
+        store=True,
+    )
+    
+    theme_color_appsmenu_text = fields.Char(
+        string='Apps Menu Text Color'
+    )
+    
+    theme_color_appbar_text = fields.Char(
+        string='AppsBar Text Color'
+    )
+    
+    theme_color_appbar_active = fields.Char(
+        string='AppsBar Active Color'
+    )
+    
+    theme_color_appbar_background = fields.Char(
+        string='AppsBar Background Color'
+    )
+    
+    #----------------------------------------------------------
+    # Helper
+    #----------------------------------------------------------
+    
+    @api.model
+    def _get_background_image_variants(self, company_id):
+        variants = []
+        for field, width in self.BACKGROUND_IMAGE_VARIANTS.items():
+            if field == 'background_image_placeholder':
+                continue
+            unique = self._get_session_image_unique(company_id, field)
+            if unique:
+                variants.append([width, field, unique])
+        return sorted(variants)
+    
+    @api.model
+    def _get_theme_color_mode(self):
+        return self.env['ir.config_parameter'].sudo().get_param(
+            'muk_web_theme.color_mode', 'scss'
+        )
+    
+    def _get_runtime_color_values(self):
+        self.ensure_one()
+        return {
+            field[len('theme_'):]: self[field].strip() 
+            for field in self.THEME_COLOR_FIELDS
+            if self[field] and COLOR_VALUE_REGEX.match(self[field].strip())
+        }
+    
+    @api.model
+    def _get_runtime_color_css(self, company_id):
+        if self._get_theme_color_mode() != 'runtime':
+            return False
+        values = self.browse(company_id)._get_runtime_color_values()
+        if not values:
+            return False
+        return ':root{%s}' % ''.join(
+            '--mk-%s:%s;' % (field.replace('_', '-'), value)
+            for field, value in sorted(values.items())
+        )
+    
+    @api.model
+    def _get_favicon_url(self, company_id, size=None):
+        field = f'favicon_png_{size}' if size else 'favicon_ico'
+        unique = self._get_session_image_unique(company_id, field)
+        if not unique:
+            if size:
+                return False
+            # sources without variants, such as SVG, are served as they are
+            unique = self._get_session_image_unique(company_id, 'favicon')
+            if unique:
+                return f'/web/image/res.company/{company_id}/favicon?unique={unique}'
+            return '/web/static/img/favicon.ico'
+        path = f'/web/favicon/{company_id}/{size}' if size else f'/web/favicon/{company_id}'
+        return f'{path}?unique={unique}'
+    
+    @api.model
+    def _recompute_vector_image_variants(self):
+        companies = self.with_context(active_test=False).search([])
+        for field, variants in [
+            ('favicon', self.FAVICON_VARIANTS), 
+            ('background_image', self.BACKGROUND_IMAGE_VARIANTS),
+        ]:
+            vector_companies = companies.filtered(
+                lambda company: company[field] and 
+                    not company._get_raster_image_source(field)
+            )
+            for variant in variants:
+                self.env.add_to_compute(self._fields[variant], vector_companies)
+        companies.flush_recordset()
+    
+    #----------------------------------------------------------
+    # Compute
+    #----------------------------------------------------------
+    
+    def _get_raster_image_source(self, field):
+        source = self[field] and base64.b64decode(self[field])
+        if source and guess_mimetype(source) == 'image/svg+xml':
+            # image_process returns vector images unchanged
+            return False
+        return source
+    
+    @api.depends('favicon')
+    def _compute_favicon_variants(self):
+        for company in self:
+            source = company._get_raster_image_source('favicon')
+            for field, (output_format, size) in self.FAVICON_VARIANTS.items():
+                variant = False
+                if source:
+                    try:
+                        variant = base64.b64encode(image_process(
+                            source, 
+                            size=(size, size), 
+                            output_format=output_format
+                        ))
+                    except UserError:
+                        _logger.warning(
+                            "Favicon of company %s could not be processed", 
+                            company.id
+                        )
+                company[field] = variant
+    
+    @api.depends('background_image')
+    def _compute_background_image_variants(self):
+        for company in self:
+            source = company._get_raster_image_source('background_image')
+            for field, width in self.BACKGROUND_IMAGE_VARIANTS.items():
+                variant = False
+                if source:
+                    try:
+                        variant = base64.b64encode(image_process(
+                            source, 
+                            size=(width, 0), 
+                            quality=80,
+                            output_format='JPEG'
+                        ))
+                    except UserError:
+                        _logger.warning(
+                            "Background image of company %s could not be processed", 
+                            company.id
+                        )
+                company[field] = variant
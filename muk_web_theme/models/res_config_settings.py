@@ -52,16 +52,30 @@ class ResConfigSettings(models.TransientModel):
         string='AppsBar Background Color'
     )
     
+    theme_color_mode = fields.Selection(
+        selection=[
+            ('scss', 'Compiled'),
+            ('runtime', 'Runtime'),
+        ],
+        string='Theme Color Mode',
+        default='scss',
+        config_parameter='muk_web_theme.color_mode',
+    )
+    
     #----------------------------------------------------------
     # Helper
     #----------------------------------------------------------
     
     def _get_theme_color_values(self):
-        return self.env['web_editor.assets'].get_color_variables_values(
+        values = self._get_color_editor().get_color_variables_values(
             self.COLOR_ASSET_THEME_URL, 
             self.COLOR_BUNDLE_THEME_NAME,
             self.THEME_COLOR_FIELDS
         )
+        if self.env['res.company']._get_theme_color_mode() == 'runtime':
+            company = self.company_id or self.env.company
+            values.update(company._get_runtime_color_values())
+        return values
         
     def _set_theme_color_values(self, values):
         colors = self._get_theme_color_values()
@@ -69,28 +83,51 @@ class ResConfigSettings(models.TransientModel):
             values[f'theme_{var}'] = value
         return values
 
-    def _detect_theme_color_change(self):
-        colors = self._get_theme_color_values()
-        return any(
-            self[f'theme_{var}'] != val
-            for var, val in colors.items()
-        )
-
-    def _replace_theme_color_values(self):
-        variables = [
+    def _get_theme_color_variables(self):
+        return [
             {
                 'name': field, 
                 'value': self[f'theme_{field}']
             }
             for field in self.THEME_COLOR_FIELDS
         ]
-        return self.env['web_editor.assets'].replace_color_variables_values(
-            self.COLOR_ASSET_THEME_URL, 
-            self.COLOR_BUNDLE_THEME_NAME,
-            variables
-        )
+    
+    @api.model
+    def _get_color_assets(self):
+        return super()._get_color_assets() + [
+            (
+                self.COLOR_ASSET_THEME_URL, 
+                self.COLOR_BUNDLE_THEME_NAME,
+                self.THEME_COLOR_FIELDS
+            ),
+        ]
+    
+    def _get_color_assets_variables(self):
+        if self.theme_color_mode == 'runtime':
+            return super()._get_color_assets_variables()
+        return super()._get_color_assets_variables() + [
+            (
+                self.COLOR_ASSET_THEME_URL, 
+                self.COLOR_BUNDLE_THEME_NAME,
+                self._get_theme_color_variables()
+            ),
+        ]
+
+    def _set_runtime_color_values(self):
+        self.company_id.write({
+            f'theme_{field}': self[f'theme_{field}'] 
+            for field in self.THEME_COLOR_FIELDS
+        })
 
     def _reset_theme_color_assets(self):
+        self.company_id.write(dict.fromkeys(
+            self.company_id.THEME_COLOR_FIELDS, False
+        ))
+        if self._reset_company_color_asset(
+            self.COLOR_ASSET_THEME_URL, 
+            self.COLOR_BUNDLE_THEME_NAME,
+        ):
+            return
         self.env['web_editor.assets'].reset_asset(
             self.COLOR_ASSET_THEME_URL, 
             self.COLOR_BUNDLE_THEME_NAME,
@@ -120,6 +157,6 @@ class ResConfigSettings(models.TransientModel):
 
     def set_values(self):
         res = super().set_values()
-        if self._detect_theme_color_change():
-            self._replace_theme_color_values()
+        if self.theme_color_mode == 'runtime':
+            self._set_runtime_color_values()
         return res
@@ -16,15 +16,32 @@ export class AppsMenu extends Dropdown {
     	this.commandPaletteOpen = false;
         this.commandService = useService("command");
     	this.companyService = useService('company');
-    	if (this.companyService.currentCompany.has_background_image) {
+    	const company = this.companyService.currentCompany;
+    	if (company.has_background_image) {
+    		const targetWidth = window.innerWidth * (window.devicePixelRatio || 1);
+    		const [, field, unique] = (company.background_image_variants || []).find(
+    			([width]) => width >= targetWidth
+    		) || [null, 'background_image', company.background_image_unique];
             this.backgroundImageUrl = url('/web/image', {
                 model: 'res.company',
-                field: 'background_image',
-                id: this.companyService.currentCompany.id,
+                field: field,
+                id: company.id,
+                unique: unique,
             });
+            if (company.background_image_placeholder_unique) {
+	            this.backgroundPlaceholderUrl = url('/web/image', {
+	                model: 'res.company',
+	                field: 'background_image_placeholder',
+	                id: company.id,
+	                unique: company.background_image_placeholder_unique,
+	            });
+            }
     	} else {
     		this.backgroundImageUrl = '/muk_web_theme/static/src/img/background.png';
     	}
+    	this.backgroundImageStyle = [
+    		this.backgroundImageUrl, this.backgroundPlaceholderUrl
+    	].filter(Boolean).map((imageUrl) => `url("${imageUrl}")`).join(', ');
         useEffect(
             (open) => {
             	if (open) {